@@ -0,0 +1,29 @@
+from django.contrib import admin
+
+from apps.api.models import ApiToken
+
+
+@admin.register(ApiToken)
+class ApiTokenAdmin(admin.ModelAdmin):
+    list_display = (
+        "name",
+        "user",
+        "prefix",
+        "created",
+    )
+    search_fields = (
+        "name",
+        "user__username",
+    )
+    readonly_fields = (
+        "user",
+        "prefix",
+        "key_hash",
+        "created",
+    )
+
+    def has_add_permission(self, request):
+        """Tokens are created by the create_api_token command, which shows
+        the key once.
+        """
+        return False
@@ -0,0 +1,55 @@
+from django.core.exceptions import ValidationError
+from django.forms import ModelChoiceField
+
+from apps.dashboard.forms import TimeForm
+from apps.project.models import Project
+
+
+class ProjectChoiceField(ModelChoiceField):
+    """ModelChoiceField looking the project up among preloaded projects,
+    so validating thousands of entries does not query every project.
+
+    Args:
+        projects (dict): The allowed projects by primary key.
+    """
+
+    def __init__(self, projects, **kwargs):
+        super().__init__(queryset=Project.objects.none(), **kwargs)
+        self.projects = projects
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        try:
+            return self.projects[int(value)]
+        except (KeyError, TypeError, ValueError):
+            raise ValidationError(
+                self.error_messages["invalid_choice"], code="invalid_choice"
+            )
+
+
+class TimeApiForm(TimeForm):
+    """TimeForm of the API.
+
+    The API stores closed time entries only, so the stop time is required
+    and no running timer has to be closed.
+
+    Args:
+        projects (dict): The projects the entries may belong to by primary
+        key.
+    """
+
+    def __init__(self, *args, projects=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["project"] = ProjectChoiceField(
+            projects or {}, required=False
+        )
+        self.fields["stop"].required = True
+
+    def _get_validation_exclusions(self):
+        """Skips the model check that the project exists, which is a query
+        per entry, since ProjectChoiceField only accepts loaded projects.
+        """
+        exclude = super()._get_validation_exclusions()
+        exclude.add("project")
+        return exclude
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.api.models import ApiToken
+from apps.profile.models import User
+
+
+class Command(BaseCommand):
+    """Creates an API token of a user and prints its key.
+
+    Only the hash of the key is stored, so the key is shown once. Revoke a
+    token by deleting it in the admin.
+    """
+
+    help = "Create an API token of a user and print its key."
+
+    def add_arguments(self, parser):
+        parser.add_argument("username", help="Owner of the token.")
+        parser.add_argument(
+            "--name",
+            default="API",
+            help="Name of the token, e.g. of the integration using it.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username=options["username"])
+        except User.DoesNotExist:
+            raise CommandError(f"User {options['username']} does not exist.")
+        _, key = ApiToken.objects.create_token(user, options["name"])
+        self.stdout.write(key)
@@ -0,0 +1,44 @@
+import json
+
+from django.http import JsonResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.csrf import csrf_exempt
+
+from apps.api.models import ApiToken
+
+TOKEN_KEYWORD = "Token"
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class TokenAuthMixin:
+    """Mixin authenticating the request by the API token in the
+    Authorization header, e.g. "Authorization: Token <key>".
+
+    The user of the token replaces the session user, so views can use
+    request.user as usual. Requests without a valid token get a JSON 401
+    response. CSRF protection is not needed, since the token is never
+    sent by the browser on its own.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        keyword, _, key = request.headers.get("Authorization", "").partition(
+            " "
+        )
+        token = None
+        if keyword == TOKEN_KEYWORD and key:
+            token = ApiToken.objects.get_by_key(key.strip())
+        if token is None:
+            response = JsonResponse({"detail": "Invalid token."}, status=401)
+            response["WWW-Authenticate"] = TOKEN_KEYWORD
+            return response
+        request.user = token.user
+        return super().dispatch(request, *args, **kwargs)
+
+    @staticmethod
+    def get_json(request):
+        """Returns the parsed JSON body of the request.
+
+        Raises:
+            ValueError: If the body is not valid JSON.
+        """
+        return json.loads(request.body)
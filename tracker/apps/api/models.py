@@ -0,0 +1,75 @@
+import hashlib
+import secrets
+
+from django.db import models
+
+from apps.core.constants import LENGTH_CHAR_FIELD
+from apps.profile.models import User
+
+TOKEN_BYTES = 32
+TOKEN_PREFIX_LENGTH = 8
+
+
+class ApiTokenManager(models.Manager):
+    def create_token(self, user, name):
+        """Creates a token of the user and returns it with its key.
+
+        Only the hash of the key is stored, so the key cannot be shown
+        again later.
+        """
+        key = secrets.token_urlsafe(TOKEN_BYTES)
+        token = self.create(
+            user=user,
+            name=name,
+            prefix=key[:TOKEN_PREFIX_LENGTH],
+            key_hash=ApiToken.hash_key(key),
+        )
+        return token, key
+
+    def get_by_key(self, key):
+        """Returns the token with the key and its user, or None."""
+        return (
+            self.select_related("user")
+            .filter(key_hash=ApiToken.hash_key(key), user__is_active=True)
+            .first()
+        )
+
+
+class ApiToken(models.Model):
+    user = models.ForeignKey(
+        User,
+        verbose_name="User",
+        on_delete=models.CASCADE,
+    )
+    name = models.CharField(
+        verbose_name="Name",
+        max_length=LENGTH_CHAR_FIELD,
+    )
+    prefix = models.CharField(
+        verbose_name="Prefix",
+        max_length=TOKEN_PREFIX_LENGTH,
+    )
+    key_hash = models.CharField(
+        verbose_name="Key hash",
+        max_length=64,
+        unique=True,
+    )
+    created = models.DateTimeField(
+        verbose_name="Created",
+        auto_now_add=True,
+    )
+
+    objects = ApiTokenManager()
+
+    class Meta:
+        verbose_name = "API token"
+        verbose_name_plural = "API tokens"
+        ordering = ("-created",)
+
+    def __str__(self):
+        return f"{self.name} ({self.prefix}...)"
+
+    @staticmethod
+    def hash_key(key):
+        """Returns the SHA-256 hash of the key as stored in key_hash."""
+        return hashlib.sha256(key.encode()).hexdigest()
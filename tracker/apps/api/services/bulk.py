@@ -0,0 +1,246 @@
+from django.db import transaction
+from django.forms.models import model_to_dict
+from django.utils.timezone import now
+
+from apps.api.forms import TimeApiForm
+from apps.core.services.version import DataVersion
+from apps.dashboard.models import Time
+from apps.dashboard.services.processor import TimeProcessor
+from apps.dashboard.services.rollup import DailyTotalProcessor
+from apps.project.models import Project
+
+MAX_BULK_SIZE = 5000
+BULK_BATCH_SIZE = 1000
+UPDATE_FIELDS = (
+    "day",
+    "start",
+    "stop",
+    "project",
+    "description",
+    "duration",
+    "updated",
+)
+
+
+def get_item_error(index, message, code="invalid"):
+    """Returns the error of an item in the format of form errors."""
+    return {
+        "index": index,
+        "errors": {"__all__": [{"message": message, "code": code}]},
+    }
+
+
+class BulkValidationError(Exception):
+    """Raised when items of a bulk request are invalid.
+
+    Attributes:
+        errors (list): The errors as dicts with the index of the item, or
+        None for the whole request, and its errors by field.
+    """
+
+    def __init__(self, errors):
+        super().__init__("Invalid items.")
+        self.errors = errors
+
+
+class TimeBulkProcessor:
+    """Creates, updates and deletes many time entries of a user at once.
+
+    Every item is validated by the rules of TimeForm. If any item is
+    invalid, BulkValidationError is raised with the errors of all items
+    and nothing is written; otherwise all items are written in one
+    transaction with bulk queries. The daily totals of the affected days
+    are then recalculated with one aggregate query.
+
+    Args:
+        user (User): The owner of the time entries.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self.projects = None
+
+    def get_projects(self):
+        """Returns the projects time can be tracked on by primary key."""
+        if self.projects is None:
+            self.projects = {
+                project.pk: project
+                for project in Project.active.filter(
+                    user=self.user, payment_type=Project.Payment.HOUR
+                )
+            }
+        return self.projects
+
+    @staticmethod
+    def check_size(items):
+        """Raises BulkValidationError unless items is a list of at most
+        MAX_BULK_SIZE items.
+        """
+        if not isinstance(items, list):
+            raise BulkValidationError(
+                [get_item_error(None, "Expected a list.")]
+            )
+        if len(items) > MAX_BULK_SIZE:
+            raise BulkValidationError(
+                [
+                    get_item_error(
+                        None,
+                        f"At most {MAX_BULK_SIZE} items are allowed.",
+                        "max_items",
+                    )
+                ]
+            )
+
+    def get_instance(self, form):
+        """Returns the time entry of the valid form, not saved yet."""
+        time = form.save(commit=False)
+        time.user = self.user
+        time.duration = TimeProcessor().get_duration(
+            time.day, time.start, time.stop
+        )
+        time.updated = now()
+        return time
+
+    @staticmethod
+    def get_data(item, instance):
+        """Returns the fields of the item over the current fields of the
+        entry to update, so fields omitted by the item keep their values.
+        """
+        if instance is None:
+            return item
+        fields = model_to_dict(instance, fields=TimeApiForm._meta.fields)
+        return {**fields, **item}
+
+    def validate(self, items, instances):
+        """Returns the unsaved time entries of the items.
+
+        Args:
+            items (list): The fields of the entries by name.
+            instances (list): The entries to update, None to create.
+
+        Raises:
+            BulkValidationError: If any item is invalid.
+        """
+        times = []
+        errors = []
+        for index, (item, instance) in enumerate(zip(items, instances)):
+            if not isinstance(item, dict):
+                errors.append(get_item_error(index, "Expected an object."))
+                continue
+            form = TimeApiForm(
+                self.get_data(item, instance),
+                instance=instance,
+                projects=self.get_projects(),
+            )
+            if form.is_valid():
+                times.append(self.get_instance(form))
+            else:
+                errors.append(
+                    {"index": index, "errors": form.errors.get_json_data()}
+                )
+        if errors:
+            raise BulkValidationError(errors)
+        return times
+
+    def get_existing(self, ids):
+        """Returns the entries of the user with the ids, locked until the
+        end of the transaction, by primary key.
+
+        Raises:
+            BulkValidationError: If an id is invalid, repeated or not found.
+        """
+        existing = {
+            time.pk: time
+            for time in Time.objects.filter(
+                user=self.user,
+                pk__in=[pk for pk in ids if isinstance(pk, int)],
+            ).select_for_update()
+        }
+        errors = []
+        seen = set()
+        for index, pk in enumerate(ids):
+            if not isinstance(pk, int) or pk not in existing:
+                errors.append(get_item_error(index, "Not found.", "not_found"))
+            elif pk in seen:
+                errors.append(get_item_error(index, "Duplicate id.", "unique"))
+            seen.add(pk)
+        if errors:
+            raise BulkValidationError(errors)
+        return existing
+
+    @staticmethod
+    def reload(times):
+        """Returns the time entries as stored, with the minutes set by the
+        database, in the same order.
+        """
+        stored = Time.objects.in_bulk([time.pk for time in times])
+        return [stored[time.pk] for time in times]
+
+    def finish(self, days):
+        """Recalculates the daily totals of the days, and once the write
+        is committed drops the cached active timer and marks the data of
+        the user as changed.
+        """
+        user_id = self.user.pk
+        DailyTotalProcessor.refresh_days(user_id, days)
+        transaction.on_commit(
+            lambda: TimeProcessor.clear_active_timer(user_id)
+        )
+        transaction.on_commit(lambda: DataVersion().bump(user_id))
+
+    def create(self, items):
+        """Creates the time entries of the items.
+
+        Returns:
+            list: The created time entries.
+
+        Raises:
+            BulkValidationError: If any item is invalid.
+        """
+        self.check_size(items)
+        times = self.validate(items, [None] * len(items))
+        with transaction.atomic():
+            Time.objects.bulk_create(times, batch_size=BULK_BATCH_SIZE)
+            self.finish({time.day for time in times})
+        return self.reload(times)
+
+    def update(self, items):
+        """Updates the time entries of the items, which carry their id and
+        the fields to change.
+
+        Returns:
+            list: The updated time entries.
+
+        Raises:
+            BulkValidationError: If any item is invalid.
+        """
+        self.check_size(items)
+        ids = [
+            item.get("id") if isinstance(item, dict) else None
+            for item in items
+        ]
+        with transaction.atomic():
+            existing = self.get_existing(ids)
+            days = {time.day for time in existing.values()}
+            times = self.validate(items, [existing[pk] for pk in ids])
+            Time.objects.bulk_update(
+                times, UPDATE_FIELDS, batch_size=BULK_BATCH_SIZE
+            )
+            self.finish(days | {time.day for time in times})
+        return self.reload(times)
+
+    def delete(self, ids):
+        """Deletes the time entries with the ids.
+
+        Returns:
+            int: The number of deleted time entries.
+
+        Raises:
+            BulkValidationError: If an id is invalid, repeated or not found.
+        """
+        self.check_size(ids)
+        with transaction.atomic():
+            existing = self.get_existing(ids)
+            Time.objects.filter(pk__in=existing).delete()
+            self.finish({time.day for time in existing.values()})
+        return len(existing)
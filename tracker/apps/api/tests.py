@@ -0,0 +1,141 @@
+import json
+from datetime import timedelta
+
+from django.urls import reverse
+from django.utils.timezone import now
+
+from apps.api.models import ApiToken
+from apps.core.paginator import KeysetPaginator
+from apps.core.testing import TrackerTestCase
+from apps.dashboard.models import DailyTotal, Time
+
+
+class TimeApiViewTest(TrackerTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.token, cls.key = ApiToken.objects.create_token(cls.user, "test")
+        cls.project = cls.user.project_set.get()
+        cls.day = now().date() - timedelta(days=1)
+
+    def request(self, method, data=None, **params):
+        """Sends an authenticated API request with the JSON body."""
+        return getattr(self.client, method)(
+            reverse("api:time"),
+            params if method == "get" else json.dumps(data),
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Token {self.key}",
+        )
+
+    def get_item(self, **fields):
+        return {
+            "day": self.day.isoformat(),
+            "start": "09:00",
+            "stop": "09:30",
+            "project": self.project.pk,
+            "description": "Work",
+            **fields,
+        }
+
+    def test_partial_update_keeps_omitted_fields(self):
+        response = self.request("post", [self.get_item()])
+        time = response.json()["results"][0]
+        response = self.request("put", [{"id": time["id"], "stop": "10:00"}])
+        self.assertEqual(response.status_code, 200)
+        updated = Time.objects.get(pk=time["id"])
+        self.assertEqual(updated.description, "Work")
+        self.assertEqual(updated.project, self.project)
+        self.assertEqual(updated.minutes, 60)
+
+    def test_invalid_token(self):
+        for authorization in ("", "Token invalid", f"Bearer {self.key}"):
+            with self.subTest(authorization=authorization):
+                response = self.client.get(
+                    reverse("api:time"), HTTP_AUTHORIZATION=authorization
+                )
+                self.assertEqual(response.status_code, 401)
+                self.assertEqual(response["WWW-Authenticate"], "Token")
+
+    def test_list_requires_day_range(self):
+        response = self.request("get")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("day", response.json()["errors"])
+
+    def test_list_paginates_by_cursor(self):
+        today = now().date().isoformat()
+        response = self.request("get", day_min=today, day_max=today, limit=2)
+        self.assertEqual(response.status_code, 200)
+        page = response.json()
+        self.assertEqual(len(page["results"]), 2)
+        response = self.request(
+            "get", day_min=today, day_max=today, cursor=page["next"]
+        )
+        self.assertEqual(len(response.json()["results"]), 1)
+
+    def test_invalid_cursor(self):
+        today = now().date().isoformat()
+        for cursor in (
+            "invalid",
+            KeysetPaginator.encode_cursor("next", ["invalid", "09:00", 1]),
+            KeysetPaginator.encode_cursor("next", [today, None, 1]),
+            KeysetPaginator.encode_cursor("next", [today, "09:00"]),
+        ):
+            with self.subTest(cursor=cursor):
+                response = self.request(
+                    "get", day_min=today, day_max=today, cursor=cursor
+                )
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(
+                    response.json(), {"detail": "Invalid cursor."}
+                )
+
+    def test_invalid_items_save_nothing(self):
+        count = Time.objects.count()
+        response = self.request(
+            "post",
+            [
+                self.get_item(),
+                self.get_item(stop="08:00"),
+                "invalid",
+                self.get_item(project=self.other.project_set.get().pk),
+            ],
+        )
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()["errors"]
+        self.assertEqual([error["index"] for error in errors], [1, 2, 3])
+        self.assertEqual(
+            set(errors[0]["errors"]["stop"][0]), {"message", "code"}
+        )
+        self.assertEqual(errors[1]["errors"]["__all__"][0]["code"], "invalid")
+        self.assertEqual(
+            errors[2]["errors"]["project"][0]["code"], "invalid_choice"
+        )
+        self.assertEqual(Time.objects.count(), count)
+
+    def test_unknown_ids_save_nothing(self):
+        time = self.user.time_set.first()
+        other = self.other.time_set.first()
+        response = self.request("delete", [time.pk, other.pk])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["errors"][0]["index"], 1)
+        self.assertTrue(Time.objects.filter(pk=time.pk).exists())
+
+    def test_bulk_writes_refresh_daily_totals(self):
+        def get_minutes():
+            return list(
+                DailyTotal.objects.filter(user=self.user, day=self.day)
+                .values_list("minutes", flat=True)
+            )
+
+        response = self.request(
+            "post",
+            [self.get_item(), self.get_item(start="10:00", stop="10:45")],
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(get_minutes(), [75])
+        ids = [time["id"] for time in response.json()["results"]]
+        self.request("put", [{"id": ids[0], "stop": "09:15"}])
+        self.assertEqual(get_minutes(), [60])
+        response = self.request("delete", ids)
+        self.assertEqual(response.json(), {"deleted": 2})
+        self.assertEqual(get_minutes(), [])
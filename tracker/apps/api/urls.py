@@ -0,0 +1,13 @@
+from django.urls import path
+
+from apps.api.views import TimeApiView
+
+app_name = "api"
+
+urlpatterns = [
+    path(
+        "time/",
+        TimeApiView.as_view(),
+        name="time",
+    ),
+]
@@ -0,0 +1,142 @@
+from django.core.paginator import InvalidPage
+from django.http import JsonResponse
+from django.views import View
+
+from apps.api.mixins import TokenAuthMixin
+from apps.api.services.bulk import BulkValidationError, TimeBulkProcessor
+from apps.core.paginator import KeysetPaginator
+from apps.dashboard.models import Time
+from apps.report.filters import ReportFilter
+from apps.report.services.choices import ReportChoices
+
+PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+TIME_FIELDS = (
+    "id",
+    "day",
+    "start",
+    "stop",
+    "project_id",
+    "description",
+    "duration",
+    "minutes",
+)
+
+
+def serialize_time(time):
+    """Returns the time entry as a JSON-serializable dict."""
+    return {
+        "id": time.pk,
+        "day": time.day,
+        "start": time.start,
+        "stop": time.stop,
+        "project": time.project_id,
+        "description": time.description,
+        "duration": time.duration,
+        "minutes": time.minutes,
+    }
+
+
+class TimeApiView(TokenAuthMixin, View):
+    """JSON API of the time entries of the token's user.
+
+    GET lists the entries filtered like the report, ordered by day and
+    start time and paginated by a cursor. POST creates, PUT updates and
+    DELETE deletes a list of entries in one transaction; if any item is
+    invalid, nothing is written and the errors of the items are returned.
+    PUT items carry the id and the fields to change.
+
+    Attributes:
+        keyset_ordering (tuple): The ordering entries are paginated by.
+        query_budget (int): The maximum number of queries per GET request.
+
+    Methods:
+        get_page_size(self): Returns the page size requested by limit.
+        get(self, request, *args, **kwargs): Lists the time entries.
+        handle_bulk(self, action, status=200): Runs a bulk action.
+        post(self, request, *args, **kwargs): Creates time entries.
+        put(self, request, *args, **kwargs): Updates time entries.
+        delete(self, request, *args, **kwargs): Deletes time entries.
+    """
+
+    keyset_ordering = ("day", "start", "id")
+    query_budget = 4
+
+    def get_page_size(self):
+        """Returns the page size requested by limit, at most MAX_PAGE_SIZE.
+
+        Raises:
+            ValueError: If limit is not a positive number.
+        """
+        page_size = int(self.request.GET.get("limit", PAGE_SIZE))
+        if page_size < 1:
+            raise ValueError("limit must be positive.")
+        return min(page_size, MAX_PAGE_SIZE)
+
+    def get(self, request, *args, **kwargs):
+        """Lists the time entries matching the report filter.
+
+        Query parameters are those of the report, of which the day range
+        day_min and day_max is required, plus cursor and limit.
+        """
+        filterset = ReportFilter(
+            request.GET,
+            queryset=Time.objects.filter(user=request.user).only(
+                *TIME_FIELDS
+            ),
+            request=request,
+            choices=ReportChoices().get_choices(request.user),
+        )
+        if not filterset.is_valid():
+            return JsonResponse(
+                {"errors": filterset.errors.get_json_data()}, status=400
+            )
+        try:
+            paginator = KeysetPaginator(
+                filterset.qs, self.get_page_size(), self.keyset_ordering
+            )
+            page = paginator.page(request.GET.get("cursor"))
+        except (InvalidPage, ValueError) as error:
+            return JsonResponse({"detail": str(error)}, status=400)
+        return JsonResponse(
+            {
+                "results": [serialize_time(time) for time in page],
+                "next": page.next_cursor,
+                "previous": page.previous_cursor,
+            }
+        )
+
+    def handle_bulk(self, action, status=200):
+        """Runs the bulk action with the JSON body of the request.
+
+        Args:
+            action (str): The name of the TimeBulkProcessor method.
+            status (int): The status of the successful response.
+        """
+        try:
+            data = self.get_json(self.request)
+        except ValueError:
+            return JsonResponse({"detail": "Invalid JSON."}, status=400)
+        processor = TimeBulkProcessor(self.request.user)
+        try:
+            result = getattr(processor, action)(data)
+        except BulkValidationError as error:
+            return JsonResponse({"errors": error.errors}, status=400)
+        if isinstance(result, int):
+            return JsonResponse({"deleted": result}, status=status)
+        return JsonResponse(
+            {"results": [serialize_time(time) for time in result]},
+            status=status,
+        )
+
+    def post(self, request, *args, **kwargs):
+        """Creates the time entries of the list in the body."""
+        return self.handle_bulk("create", status=201)
+
+    def put(self, request, *args, **kwargs):
+        """Updates the time entries of the list in the body by their id."""
+        return self.handle_bulk("update")
+
+    def delete(self, request, *args, **kwargs):
+        """Deletes the time entries with the ids listed in the body."""
+        return self.handle_bulk("delete")
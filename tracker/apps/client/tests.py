@@ -0,0 +1,14 @@
+from django.urls import reverse
+
+from apps.client.views import ClientListView
+from apps.core.testing import TrackerTestCase
+
+
+class ClientListViewTest(TrackerTestCase):
+    def test_query_budget(self):
+        response = self.assertWithinQueryBudget(
+            ClientListView, reverse("client:list")
+        )
+        client = response.context["page_obj"][0]
+        self.assertEqual(client.project_count, 1)
+        self.assertEqual(client.total_minutes, 60)
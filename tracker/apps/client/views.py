@@ -7,7 +7,8 @@ from apps.client.filters import ClientFilter
 from apps.client.forms import ClientForm
 from apps.client.models import Client
 from apps.core.constants import CREATE, UPDATE, DELETE
-from apps.core.mixins import UserAccessMixin
+from apps.core.mixins import KeysetPaginationMixin, UserAccessMixin
+from apps.dashboard.services.activity import ActivityAnnotator
 
 
 TITLE = "Client"
@@ -15,7 +16,7 @@ CLIENT_LIST = "client:list"
 DELETE_LINK = "client:delete"
 
 
-class ClientListView(LoginRequiredMixin, FilterView):
+class ClientListView(LoginRequiredMixin, KeysetPaginationMixin, FilterView):
     """View for displaying a paginated list of clients associated with the
     logged-in user.
 
@@ -25,6 +26,8 @@ class ClientListView(LoginRequiredMixin, FilterView):
         filtering.
         template_name (str): The name of the template to be rendered.
         paginate_by (int): Number of clients to display per page.
+        keyset_ordering (tuple): The ordering clients are paginated by.
+        query_budget (int): The maximum number of queries per GET request.
 
     Methods:
         get_queryset(self): Returns the queryset of clients associated with
@@ -35,12 +38,16 @@ class ClientListView(LoginRequiredMixin, FilterView):
     filterset_class = ClientFilter
     template_name = "client/list.html"
     paginate_by = 10
+    keyset_ordering = ("name", "id")
+    query_budget = 3
 
     def get_queryset(self):
-        """Returns queryset of clients associated with the logged-in user."""
+        """Returns queryset of clients associated with the logged-in user,
+        annotated with their projects and the time tracked on them.
+        """
         user = self.request.user
         queryset = user.client_set.all()
-        return queryset
+        return ActivityAnnotator(user).annotate_clients(queryset)
 
 
 class ClientView:
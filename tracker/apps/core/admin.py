@@ -0,0 +1,16 @@
+from django.contrib import admin
+
+from apps.core.models import OutgoingEmail
+
+
+@admin.register(OutgoingEmail)
+class OutgoingEmailAdmin(admin.ModelAdmin):
+    list_display = (
+        "subject",
+        "recipients",
+        "status",
+        "attempts",
+        "send_after",
+        "sent",
+    )
+    list_filter = ("status",)
@@ -0,0 +1,39 @@
+from django.db.models import (
+    Func,
+    PositiveIntegerField,
+    PositiveSmallIntegerField,
+)
+
+
+class RoundedHours(Func):
+    """Converts an interval to whole hours in SQL.
+
+    Half an hour and more is rounded up, the same way as
+    TimeProcessor.get_duration does it in Python.
+    """
+
+    template = "FLOOR((EXTRACT(EPOCH FROM %(expressions)s) + 1800) / 3600)"
+    output_field = PositiveSmallIntegerField()
+
+
+class Minutes(Func):
+    """Converts an interval to whole minutes in SQL, dropping the seconds."""
+
+    template = "FLOOR(EXTRACT(EPOCH FROM %(expressions)s) / 60)"
+    output_field = PositiveIntegerField()
+
+
+class RoundedMinutes(Func):
+    """Rounds a number of minutes to a multiple of the step in SQL.
+
+    Half a step and more is rounded up, so a step of 60 rounds to whole
+    hours the same way as RoundedHours.
+    """
+
+    template = "((%(expressions)s + %(half)s) / %(step)s * %(step)s)"
+    output_field = PositiveIntegerField()
+
+    def __init__(self, expression, step, **extra):
+        super().__init__(
+            expression, step=int(step), half=int(step) // 2, **extra
+        )
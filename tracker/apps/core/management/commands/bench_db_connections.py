@@ -0,0 +1,62 @@
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+from django.core.signals import request_finished, request_started
+from django.db import connection
+
+REQUESTS = 200
+
+
+class Command(BaseCommand):
+    """Measures the per-request cost of opening database connections.
+
+    Each simulated request goes through the request_started and
+    request_finished signals, so Django opens, reuses and health-checks
+    connections exactly as it does while serving HTTP requests. The run
+    is repeated with a new connection per request (CONN_MAX_AGE=0) and
+    with the configured persistent connection settings.
+    """
+
+    help = "Compare per-request time with new and persistent connections."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=REQUESTS,
+            help="Number of simulated requests per run.",
+        )
+
+    def run(self, conn_max_age, requests):
+        """Returns the mean time of one simulated request in ms."""
+        connection.close()
+        connection.settings_dict["CONN_MAX_AGE"] = conn_max_age
+        start = perf_counter()
+        for _ in range(requests):
+            request_started.send(sender=self.__class__)
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            request_finished.send(sender=self.__class__)
+        elapsed = perf_counter() - start
+        connection.close()
+        return elapsed / requests * 1000
+
+    def handle(self, *args, **options):
+        conn_max_age = connection.settings_dict["CONN_MAX_AGE"]
+        health_checks = connection.settings_dict["CONN_HEALTH_CHECKS"]
+        try:
+            new = self.run(0, options["requests"])
+            persistent = self.run(conn_max_age, options["requests"])
+        finally:
+            connection.settings_dict["CONN_MAX_AGE"] = conn_max_age
+        self.stdout.write(f"New connection per request: {new:.2f} ms")
+        self.stdout.write(
+            f"Persistent (CONN_MAX_AGE={conn_max_age}, "
+            f"CONN_HEALTH_CHECKS={health_checks}): {persistent:.2f} ms"
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Connection setup saved per request: "
+                f"{new - persistent:.2f} ms"
+            )
+        )
@@ -0,0 +1,190 @@
+import json
+import platform
+import statistics
+from datetime import timedelta
+from time import perf_counter
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client as HttpClient
+from django.test.utils import (
+    CaptureQueriesContext,
+    setup_test_environment,
+    teardown_test_environment,
+)
+from django.urls import reverse
+from django.utils.timezone import now
+
+from apps.client.models import Client
+from apps.core.management.commands.seed_benchmark_data import USERNAME
+from apps.dashboard.models import Time
+from apps.dashboard.services.rollup import DailyTotalProcessor
+from apps.profile.models import User
+from apps.project.models import Project
+
+ITERATIONS = 20
+WARMUP = 2
+OUTPUT = "benchmark_results.json"
+
+
+class Command(BaseCommand):
+    """Times the main user flows against the data of seed_benchmark_data.
+
+    Every flow is requested through the Django test client, so the
+    measurements include the middleware, the view, the queries and the
+    template rendering, but not the network or the application server.
+    The results are written as JSON for comparison between runs.
+    """
+
+    help = "Time the dashboard, report, project list and create flows."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--username",
+            default=USERNAME.format(1),
+            help="Benchmark user created by seed_benchmark_data.",
+        )
+        parser.add_argument("--iterations", type=int, default=ITERATIONS)
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=WARMUP,
+            help="Untimed requests per flow, e.g. to fill the caches.",
+        )
+        parser.add_argument("--output", default=OUTPUT)
+
+    def get_flows(self, user):
+        """Returns the benchmarked requests by flow name.
+
+        Each flow is a callable that makes one request and returns the
+        response, and an optional callable cleaning up after it.
+        """
+        client = self.client
+        today = now().date()
+        day = today - timedelta(days=1)
+        project = Project.active.filter(
+            user=user, payment_type=Project.Payment.HOUR
+        ).first()
+        if project is None:
+            raise CommandError(
+                f"User {user.username} has no active hourly project, "
+                "run seed_benchmark_data first."
+            )
+        report = {
+            "day_min": (today - timedelta(days=365)).isoformat(),
+            "day_max": today.isoformat(),
+        }
+
+        def create_entry():
+            response = client.post(
+                reverse("dashboard:create"),
+                {
+                    "day": day.isoformat(),
+                    "start": "23:00",
+                    "stop": "23:30",
+                    "project": project.pk,
+                    "description": "Benchmark",
+                },
+            )
+            if response.status_code != 302:
+                raise CommandError("The time entry was not created.")
+            return response
+
+        def delete_entry():
+            time = Time.objects.filter(user=user).latest("id")
+            time.delete()
+            DailyTotalProcessor().refresh_for(time)
+
+        return {
+            "dashboard": (
+                lambda: client.get(
+                    reverse("dashboard:dashboard"), {"day": day.isoformat()}
+                ),
+                None,
+            ),
+            "report": (
+                lambda: client.get(reverse("report:report"), report),
+                None,
+            ),
+            "project_list": (
+                lambda: client.get(reverse("project:list")),
+                None,
+            ),
+            "create_entry": (create_entry, delete_entry),
+        }
+
+    def run_flow(self, request, cleanup, iterations, warmup):
+        """Returns the timings and query counts of the flow."""
+        timings = []
+        queries = []
+        for i in range(warmup + iterations):
+            with CaptureQueriesContext(connection) as context:
+                start = perf_counter()
+                response = request()
+                elapsed = perf_counter() - start
+            if response.status_code >= 400:
+                raise CommandError(
+                    f"{response.request['PATH_INFO']} returned "
+                    f"{response.status_code}."
+                )
+            if cleanup:
+                cleanup()
+            if i >= warmup:
+                timings.append(elapsed * 1000)
+                queries.append(len(context.captured_queries))
+        timings.sort()
+        return {
+            "iterations": iterations,
+            "min_ms": round(timings[0], 2),
+            "median_ms": round(statistics.median(timings), 2),
+            "p95_ms": round(timings[int(len(timings) * 0.95)], 2),
+            "max_ms": round(timings[-1], 2),
+            "queries": max(queries),
+        }
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(username=options["username"]).first()
+        if user is None:
+            raise CommandError(
+                f"User {options['username']} not found, "
+                "run seed_benchmark_data first."
+            )
+        if options["iterations"] < 1:
+            raise CommandError("--iterations must be positive.")
+        setup_test_environment()
+        try:
+            self.client = HttpClient()
+            self.client.force_login(user)
+            results = {
+                name: self.run_flow(
+                    request, cleanup, options["iterations"], options["warmup"]
+                )
+                for name, (request, cleanup) in self.get_flows(user).items()
+            }
+        finally:
+            teardown_test_environment()
+        data = {
+            "created": now().isoformat(),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "database": connection.vendor,
+            "username": user.username,
+            "rows": {
+                "time": Time.objects.filter(user=user).count(),
+                "project": Project.objects.filter(user=user).count(),
+                "client": Client.objects.filter(user=user).count(),
+            },
+            "results": results,
+        }
+        with open(options["output"], "w") as file:
+            json.dump(data, file, indent=2)
+        for name, result in results.items():
+            self.stdout.write(
+                f"{name:<14} median {result['median_ms']:>8.2f} ms  "
+                f"p95 {result['p95_ms']:>8.2f} ms  "
+                f"queries {result['queries']}"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f"Results written to {options['output']}.")
+        )
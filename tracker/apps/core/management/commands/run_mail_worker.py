@@ -0,0 +1,53 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.core.services.mail import MAIL_BATCH_SIZE, MailOutbox
+
+POLL_INTERVAL = 5
+
+
+class Command(BaseCommand):
+    """Sends the emails queued in the outbox.
+
+    Runs until interrupted, polling the outbox while it is empty. Several
+    workers may run at the same time.
+    """
+
+    help = "Send the queued emails in batches over one SMTP connection."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=MAIL_BATCH_SIZE,
+            help="Number of emails sent over one connection.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=POLL_INTERVAL,
+            help="Seconds to wait when there is nothing to send.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Send the due emails and exit.",
+        )
+
+    def handle(self, *args, **options):
+        outbox = MailOutbox()
+        batch_size = options["batch_size"]
+        try:
+            while True:
+                close_old_connections()
+                processed, sent = outbox.send_pending(batch_size)
+                if processed:
+                    self.stdout.write(f"Sent {sent} of {processed} emails.")
+                if processed < batch_size:
+                    if options["once"]:
+                        break
+                    time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,138 @@
+import random
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils.timezone import now
+
+from apps.client.models import Client
+from apps.dashboard.models import Time
+from apps.dashboard.services.processor import TimeProcessor
+from apps.dashboard.services.rollup import DailyTotalProcessor
+from apps.profile.models import User
+from apps.project.models import Project
+
+USERNAME = "bench_{}"
+PASSWORD = "benchmark"
+USERS = 1
+YEARS = 5
+ENTRIES_PER_DAY = 20
+CLIENTS = 10
+PROJECTS = 30
+BATCH_SIZE = 5000
+DAY_START = datetime.strptime("07:00", "%H:%M")
+SLOT_MINUTES = 45
+
+
+class Command(BaseCommand):
+    """Generates accounts with realistic volumes of clients, projects and
+    time entries for benchmarks.
+
+    Existing benchmark users are replaced. The entries of a day are laid
+    out in consecutive slots from 07:00, so they never overlap, and the
+    daily totals are rebuilt afterwards.
+    """
+
+    help = "Create benchmark users with years of time entries."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=USERS)
+        parser.add_argument("--years", type=int, default=YEARS)
+        parser.add_argument(
+            "--entries-per-day", type=int, default=ENTRIES_PER_DAY
+        )
+        parser.add_argument("--clients", type=int, default=CLIENTS)
+        parser.add_argument("--projects", type=int, default=PROJECTS)
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Seed of the random generator, for reproducible data.",
+        )
+
+    @staticmethod
+    def create_user(index):
+        """Creates the benchmark user, replacing an existing one."""
+        username = USERNAME.format(index)
+        User.objects.filter(username=username).delete()
+        return User.objects.create_user(
+            username=username,
+            email=f"{username}@example.com",
+            password=PASSWORD,
+        )
+
+    @staticmethod
+    def create_projects(user, clients, projects, rng):
+        """Creates the clients and projects of the user."""
+        clients = Client.objects.bulk_create(
+            Client(user=user, name=f"Client {i + 1}") for i in range(clients)
+        )
+        return Project.objects.bulk_create(
+            Project(
+                user=user,
+                name=f"Project {i + 1}",
+                client=rng.choice(clients + [None]),
+                status=rng.choice(Project.Status.values),
+                billing=rng.random() < 0.7,
+                amount=rng.randrange(10, 200),
+                payment_type=(
+                    Project.Payment.HOUR
+                    if rng.random() < 0.8
+                    else Project.Payment.MONTH
+                ),
+            )
+            for i in range(projects)
+        )
+
+    @staticmethod
+    def generate_times(user, projects, days, entries_per_day, rng):
+        """Yields the closed time entries of the user for the past days."""
+        today = now().date()
+        for offset in range(days, 0, -1):
+            day = today - timedelta(days=offset)
+            for slot in range(entries_per_day):
+                start = DAY_START + timedelta(minutes=slot * SLOT_MINUTES)
+                stop = start + timedelta(
+                    minutes=rng.randrange(5, SLOT_MINUTES)
+                )
+                if stop.date() != start.date():
+                    break
+                yield Time(
+                    user=user,
+                    project=rng.choice(projects),
+                    day=day,
+                    start=start.time(),
+                    stop=stop.time(),
+                    duration=TimeProcessor.get_duration(
+                        day, start.time(), stop.time()
+                    ),
+                    description=f"Task {slot + 1}",
+                )
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        days = options["years"] * 365
+        for index in range(1, options["users"] + 1):
+            with transaction.atomic():
+                user = self.create_user(index)
+                projects = self.create_projects(
+                    user, options["clients"], options["projects"], rng
+                )
+                Time.objects.bulk_create(
+                    self.generate_times(
+                        user,
+                        projects,
+                        days,
+                        options["entries_per_day"],
+                        rng,
+                    ),
+                    batch_size=BATCH_SIZE,
+                )
+                DailyTotalProcessor.rebuild(user.pk)
+            count = Time.objects.filter(user=user).count()
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{user.username}: {count} time entries, "
+                    f"password {PASSWORD!r}."
+                )
+            )
@@ -0,0 +1,103 @@
+import json
+import logging
+from time import perf_counter
+
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+
+class QueryMetrics:
+    """Database execute wrapper counting the queries and their time."""
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.render_time = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_time += perf_counter() - start
+
+
+class QueryMetricsMiddleware:
+    """Measures the query count, database time, template render time and
+    total time of every request.
+
+    The metrics are returned in the Server-Timing header and logged as
+    JSON to the "apps.core.middleware" logger. Views may declare a
+    query_budget for GET requests; exceeding it is logged as a warning and
+    reported in the X-Query-Budget header, the response itself is never
+    changed. The budgets are enforced by the tests of the views.
+
+    The middleware is enabled by settings.QUERY_METRICS. Queries run while
+    a streaming response is consumed are not counted.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics = QueryMetrics()
+        request.query_metrics = metrics
+        start = perf_counter()
+        with connection.execute_wrapper(metrics):
+            response = self.get_response(request)
+        total_time = perf_counter() - start
+        view = self.get_view(request)
+        record = {
+            "view": view and view.__qualname__,
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "queries": metrics.queries,
+            "db_ms": round(metrics.db_time * 1000, 1),
+            "render_ms": round(metrics.render_time * 1000, 1),
+            "total_ms": round(total_time * 1000, 1),
+        }
+        response["Server-Timing"] = (
+            f'db;dur={record["db_ms"]};desc="{metrics.queries} queries", '
+            f'render;dur={record["render_ms"]}, total;dur={record["total_ms"]}'
+        )
+        logger.info(json.dumps(record))
+        if request.method in ("GET", "HEAD"):
+            self.check_budget(view, metrics.queries, response)
+        return response
+
+    def process_template_response(self, request, response):
+        """Measures the time of rendering the template response."""
+        start = perf_counter()
+
+        def set_render_time(response):
+            request.query_metrics.render_time = perf_counter() - start
+
+        response.add_post_render_callback(set_render_time)
+        return response
+
+    @staticmethod
+    def get_view(request):
+        """Returns the view class or function that handled the request."""
+        if request.resolver_match is None:
+            return None
+        func = request.resolver_match.func
+        return getattr(func, "view_class", func)
+
+    @staticmethod
+    def check_budget(view, queries, response):
+        """Reports the view running more queries than its budget in the
+        log and the X-Query-Budget header of the response.
+        """
+        budget = getattr(view, "query_budget", None)
+        if budget is None or queries <= budget:
+            return
+        logger.warning(
+            f"{view.__qualname__} ran {queries} queries, "
+            f"the budget is {budget}."
+        )
+        response["X-Query-Budget"] = (
+            f"exceeded; queries={queries}; budget={budget}"
+        )
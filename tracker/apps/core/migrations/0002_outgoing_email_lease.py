@@ -0,0 +1,39 @@
+# Generated by Django 4.2.4 on 2026-10-18 14:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="outgoingemail",
+            name="outgoing_email_pending_idx",
+        ),
+        migrations.AlterField(
+            model_name="outgoingemail",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("Pending", "Pending"),
+                    ("Sending", "Sending"),
+                    ("Sent", "Sent"),
+                    ("Failed", "Failed"),
+                ],
+                default="Pending",
+                max_length=150,
+                verbose_name="Status",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="outgoingemail",
+            index=models.Index(
+                condition=models.Q(("status__in", ("Pending", "Sending"))),
+                fields=["send_after"],
+                name="outgoing_email_due_idx",
+            ),
+        ),
+    ]
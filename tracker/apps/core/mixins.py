@@ -1,18 +1,37 @@
-from django.contrib.auth.mixins import LoginRequiredMixin
+import hashlib
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.mixins import AccessMixin, LoginRequiredMixin
+from django.core.paginator import InvalidPage
 from django.http import Http404
 from django.shortcuts import redirect
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from django.utils.timezone import now
+
+from apps.core.paginator import KeysetPaginator
+from apps.core.services.version import DataVersion
 
 
 class UserAccessMixin(LoginRequiredMixin):
     """Mixin to enforce user access control in views.
 
-    This mixin requires the user to be authenticated. Additionally,
-    it checks whether the user making the request has access to the object
-    in question. If not, a 404 HTTP error is raised.
+    This mixin requires the user to be authenticated. The queryset is
+    filtered by the user making the request, so the object is looked up and
+    its owner checked by one indexed query, and objects of other users
+    raise a 404 HTTP error. The object is loaded once per request, and its
+    user is taken from the request instead of another query.
+
+    Attributes:
+        related_fields (tuple): The foreign keys loaded together with the
+        object.
     """
 
+    related_fields = ()
+    _object = None
+
     def dispatch(self, request, *args, **kwargs):
-        """Checking user authentication and access to the object.
+        """Checking user authentication.
 
         Args:
             request (HttpRequest): The HTTP request object.
@@ -21,13 +40,197 @@ class UserAccessMixin(LoginRequiredMixin):
 
         Returns:
             HttpResponse: The HTTP response after processing the request.
-
-        Raises:
-            Http404: If the user is not authenticated or does not have access
-            to the object.
         """
         if not request.user.is_authenticated:
             return redirect("login")
-        if self.get_object().user != request.user:
-            raise Http404
         return super().dispatch(request, *args, **kwargs)
+
+    def get_queryset(self):
+        """Returns the queryset of objects of the logged-in user."""
+        queryset = super().get_queryset().filter(user=self.request.user)
+        if self.related_fields:
+            queryset = queryset.select_related(*self.related_fields)
+        return queryset
+
+    def get_object(self, queryset=None):
+        """Returns the object of the logged-in user, loaded once per request.
+
+        Args:
+            queryset (QuerySet): The queryset to look the object up in,
+            get_queryset() if not given.
+
+        Raises:
+            Http404: If the object does not exist or belongs to another
+            user.
+        """
+        if queryset is not None:
+            return super().get_object(queryset)
+        if self._object is None:
+            self._object = super().get_object()
+            self._object.user = self.request.user
+        return self._object
+
+
+class AsyncLoginRequiredMixin(AccessMixin):
+    """Mixin requiring an authenticated user for views with async handlers.
+
+    The user is loaded from the session in a worker thread, because the
+    ORM cannot be used synchronously from the event loop. Later accesses
+    to request.user reuse the loaded user.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        """Checking user authentication before calling the async handler.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            *args: Additional positional arguments.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            HttpResponse: The HTTP response after processing the request.
+        """
+        is_authenticated = await sync_to_async(
+            lambda: request.user.is_authenticated
+        )()
+        if not is_authenticated:
+            return self.handle_no_permission()
+        return await super().dispatch(request, *args, **kwargs)
+
+
+class KeysetPaginationMixin:
+    """Mixin switching a list view to keyset pagination.
+
+    Views opt in by setting keyset_ordering to a unique ordering of the
+    listed objects. Pages are then addressed by a cursor instead of a page
+    number, and no COUNT query is issued.
+
+    Attributes:
+        keyset_ordering (tuple): The field names the objects are paginated
+        by, or None to keep the offset pagination.
+        cursor_kwarg (str): The name of the GET parameter with the cursor.
+    """
+
+    keyset_ordering = None
+    cursor_kwarg = "cursor"
+    keyset_page = None
+
+    def paginate_queryset(self, queryset, page_size):
+        """Paginates the queryset by the cursor from the request.
+
+        The page fetched beforehand by apaginate_queryset() is reused.
+
+        Raises:
+            Http404: If the cursor is not valid.
+        """
+        if self.keyset_ordering is None:
+            return super().paginate_queryset(queryset, page_size)
+        paginator = KeysetPaginator(queryset, page_size, self.keyset_ordering)
+        page = self.keyset_page
+        if page is None:
+            try:
+                page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+            except InvalidPage:
+                raise Http404
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    async def apaginate_queryset(self, queryset, page_size):
+        """Fetches the page by the cursor from the request with the async
+        ORM, so that building the context does not query the database.
+
+        Raises:
+            Http404: If the cursor is not valid.
+        """
+        paginator = KeysetPaginator(queryset, page_size, self.keyset_ordering)
+        try:
+            self.keyset_page = await paginator.apage(
+                self.request.GET.get(self.cursor_kwarg)
+            )
+        except InvalidPage:
+            raise Http404
+
+    def get_context_data(self, **kwargs):
+        """Adds the query string without the pagination parameters."""
+        context = super().get_context_data(**kwargs)
+        query_params = self.request.GET.copy()
+        for param in (self.cursor_kwarg, self.page_kwarg):
+            query_params.pop(param, None)
+        context["urlencode"] = query_params.urlencode()
+        return context
+
+
+class AsyncFilterViewMixin:
+    """Mixin handling the GET requests of a FilterView in a coroutine.
+
+    Views fetch the objects with the async ORM in aget_context_data(), so
+    a slow query does not hold a worker thread.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        """Handles GET requests and renders the filtered objects.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            *args: Additional positional arguments.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            HttpResponse: The HTTP response after processing the request.
+        """
+        self.filterset = self.get_filterset(self.get_filterset_class())
+        is_valid = await sync_to_async(self.filterset.is_valid)()
+        if not self.filterset.is_bound or is_valid or not self.get_strict():
+            self.object_list = self.filterset.qs
+        else:
+            self.object_list = self.filterset.queryset.none()
+        context = await self.aget_context_data(
+            filter=self.filterset, object_list=self.object_list
+        )
+        return self.render_to_response(context)
+
+    async def aget_context_data(self, **kwargs):
+        """Returns the context data for rendering the template."""
+        return self.get_context_data(**kwargs)
+
+
+class ConditionalGetMixin:
+    """Mixin answering repeated GET requests with 304 Not Modified while
+    the data of the user is unchanged.
+
+    The ETag is derived from the data version of the user, the requested
+    URL and the current date, so the 304 response is returned before any
+    query or template rendering. Views return False from
+    ais_not_modified_allowed() for pages that change without a write,
+    e.g. a running timer.
+    """
+
+    async def ais_not_modified_allowed(self):
+        """Returns whether the page may be answered by a 304 response."""
+        return True
+
+    async def get(self, request, *args, **kwargs):
+        """Handles GET requests, answering unchanged pages with 304.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            *args: Additional positional arguments.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            HttpResponse: The HTTP response after processing the request.
+        """
+        if not await self.ais_not_modified_allowed():
+            return await super().get(request, *args, **kwargs)
+        stamp = await DataVersion().aget(request.user.pk)
+        key = f"{request.user.pk}:{stamp}:{request.get_full_path()}"
+        key = f"{key}:{now().date()}"
+        etag = quote_etag(hashlib.md5(key.encode()).hexdigest())
+        response = get_conditional_response(
+            request, etag=etag, last_modified=int(stamp)
+        )
+        if response is None:
+            response = await super().get(request, *args, **kwargs)
+            response.headers.setdefault("ETag", etag)
+            response.headers.setdefault("Last-Modified", http_date(stamp))
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
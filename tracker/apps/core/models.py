@@ -0,0 +1,69 @@
+from django.db import models
+from django.utils.timezone import now
+
+from apps.core.constants import LENGTH_CHAR_FIELD
+
+
+class OutgoingEmail(models.Model):
+    class Status(models.TextChoices):
+        PENDING = "Pending", "Pending"
+        SENDING = "Sending", "Sending"
+        SENT = "Sent", "Sent"
+        FAILED = "Failed", "Failed"
+
+    subject = models.CharField(
+        verbose_name="Subject",
+        max_length=LENGTH_CHAR_FIELD,
+    )
+    body = models.TextField(
+        verbose_name="Body",
+    )
+    from_email = models.CharField(
+        verbose_name="From",
+        max_length=LENGTH_CHAR_FIELD,
+    )
+    recipients = models.JSONField(
+        verbose_name="Recipients",
+    )
+    status = models.CharField(
+        verbose_name="Status",
+        max_length=LENGTH_CHAR_FIELD,
+        choices=Status.choices,
+        default=Status.PENDING,
+    )
+    attempts = models.PositiveSmallIntegerField(
+        verbose_name="Attempts",
+        default=0,
+    )
+    send_after = models.DateTimeField(
+        verbose_name="Send after",
+        default=now,
+    )
+    last_error = models.TextField(
+        verbose_name="Last error",
+        blank=True,
+    )
+    created = models.DateTimeField(
+        verbose_name="Created",
+        auto_now_add=True,
+    )
+    sent = models.DateTimeField(
+        verbose_name="Sent",
+        blank=True,
+        null=True,
+    )
+
+    class Meta:
+        verbose_name = "Outgoing email"
+        verbose_name_plural = "Outgoing emails"
+        ordering = ("send_after",)
+        indexes = (
+            models.Index(
+                fields=("send_after",),
+                condition=models.Q(status__in=("Pending", "Sending")),
+                name="outgoing_email_due_idx",
+            ),
+        )
+
+    def __str__(self):
+        return self.subject
@@ -0,0 +1,193 @@
+import base64
+import binascii
+import json
+from functools import reduce
+from operator import or_
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+
+NEXT = "next"
+PREVIOUS = "previous"
+
+
+class KeysetPage:
+    """A page of objects returned by KeysetPaginator.
+
+    Attributes:
+        object_list (list): The objects of the page.
+        next_cursor (str): The cursor of the following page.
+        previous_cursor (str): The cursor of the preceding page.
+    """
+
+    def __init__(self, object_list, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    """Paginator that seeks to a page by the ordering values of the last
+    object of the previous page instead of using OFFSET.
+
+    Pages are fetched with a single indexed query and without counting
+    the objects, so a deep page costs the same as the first one. The
+    ordering must be unique, e.g. end with the primary key.
+
+    Attributes:
+        queryset (QuerySet): The objects to paginate.
+        per_page (int): The number of objects on a page.
+        ordering (tuple): The field names the objects are ordered by,
+        prefixed with "-" for descending order.
+    """
+
+    def __init__(self, queryset, per_page, ordering):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        self.ordering = tuple(ordering)
+
+    @staticmethod
+    def encode_cursor(direction, values):
+        """Returns the URL-safe cursor for the given ordering values."""
+        data = json.dumps([direction, values], cls=DjangoJSONEncoder)
+        return base64.urlsafe_b64encode(data.encode()).decode()
+
+    def decode_cursor(self, cursor):
+        """Returns the direction and ordering values stored in the cursor.
+
+        Raises:
+            InvalidPage: If the cursor is malformed or its values do not
+            match the ordering fields.
+        """
+        try:
+            direction, values = json.loads(base64.urlsafe_b64decode(cursor))
+        except (binascii.Error, TypeError, ValueError):
+            raise InvalidPage("Invalid cursor.")
+        if direction not in (NEXT, PREVIOUS) or not isinstance(values, list):
+            raise InvalidPage("Invalid cursor.")
+        if len(values) != len(self.ordering):
+            raise InvalidPage("Invalid cursor.")
+        return direction, self.to_python(values)
+
+    def to_python(self, values):
+        """Returns the cursor values converted by their ordering fields.
+
+        Raises:
+            InvalidPage: If a value is not valid for its field.
+        """
+        opts = self.queryset.model._meta
+        converted = []
+        for field, value in zip(self.ordering, values):
+            model_field = opts.get_field(field.lstrip("-"))
+            try:
+                value = model_field.to_python(value)
+                if value is None:
+                    raise ValueError("Empty cursor value.")
+                converted.append(model_field.get_prep_value(value))
+            except (ValidationError, TypeError, ValueError):
+                raise InvalidPage("Invalid cursor.")
+        return converted
+
+    def get_values(self, obj):
+        """Returns the ordering values of the object."""
+        return [getattr(obj, field.lstrip("-")) for field in self.ordering]
+
+    def seek(self, values, forward):
+        """Returns the filter selecting the objects after (or before)
+        the given ordering values.
+        """
+        conditions = []
+        for i, field in enumerate(self.ordering):
+            name = field.lstrip("-")
+            ascending = (field[0] != "-") == forward
+            lookup = {f"{name}__{'gt' if ascending else 'lt'}": values[i]}
+            equal = {
+                f.lstrip("-"): v for f, v in zip(self.ordering, values[:i])
+            }
+            conditions.append(Q(**equal, **lookup))
+        return reduce(or_, conditions)
+
+    def get_page_queryset(self, cursor):
+        """Returns the sliced queryset of the page the cursor points to and
+        whether the page is fetched forward.
+
+        Raises:
+            InvalidPage: If the cursor is malformed.
+        """
+        queryset = self.queryset
+        forward = True
+        if cursor:
+            direction, values = self.decode_cursor(cursor)
+            forward = direction == NEXT
+            queryset = queryset.filter(self.seek(values, forward))
+        ordering = self.ordering
+        if not forward:
+            ordering = tuple(
+                f[1:] if f[0] == "-" else f"-{f}" for f in self.ordering
+            )
+        return queryset.order_by(*ordering)[: self.per_page + 1], forward
+
+    def get_page(self, object_list, cursor, forward):
+        """Returns the page built from the fetched objects."""
+        has_more = len(object_list) > self.per_page
+        object_list = object_list[: self.per_page]
+        if not forward:
+            object_list.reverse()
+        has_next = has_more if forward else True
+        has_previous = bool(cursor) if forward else has_more
+        if not object_list:
+            return KeysetPage(object_list, None, None)
+        return KeysetPage(
+            object_list,
+            next_cursor=(
+                self.encode_cursor(NEXT, self.get_values(object_list[-1]))
+                if has_next
+                else None
+            ),
+            previous_cursor=(
+                self.encode_cursor(PREVIOUS, self.get_values(object_list[0]))
+                if has_previous
+                else None
+            ),
+        )
+
+    def page(self, cursor=None):
+        """Returns the page the cursor points to, or the first page.
+
+        Args:
+            cursor (str): The cursor taken from a previously returned page.
+
+        Raises:
+            InvalidPage: If the cursor is malformed.
+        """
+        queryset, forward = self.get_page_queryset(cursor)
+        return self.get_page(list(queryset), cursor, forward)
+
+    async def apage(self, cursor=None):
+        """Async version of page() fetching the objects with the async ORM.
+
+        Raises:
+            InvalidPage: If the cursor is malformed.
+        """
+        queryset, forward = self.get_page_queryset(cursor)
+        return self.get_page([obj async for obj in queryset], cursor, forward)
@@ -0,0 +1,163 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import F
+from django.utils.timezone import now
+
+from apps.core.models import OutgoingEmail
+
+MAIL_BATCH_SIZE = 50
+MAIL_MAX_ATTEMPTS = 5
+MAIL_RETRY_DELAY = 60
+MAIL_MAX_RETRY_DELAY = 60 * 60
+MAIL_LEASE = 60 * 10
+UPDATE_FIELDS = ("status", "attempts", "send_after", "last_error", "sent")
+
+
+class MailOutbox:
+    """Database-backed queue of outgoing emails.
+
+    Requests only store the message, and the mail worker sends the
+    pending messages in batches over one SMTP connection, so the response
+    time does not depend on the mail server. Failed messages are retried
+    with exponential backoff until MAIL_MAX_ATTEMPTS is reached.
+
+    A worker claims a batch by marking it as sending with a lease of
+    MAIL_LEASE seconds in a short transaction, then sends it without
+    holding a transaction open. Emails of a worker that died are claimed
+    again once their lease has expired. Every claim counts as an attempt,
+    so an email that keeps crashing the worker fails after
+    MAIL_MAX_ATTEMPTS claims as well.
+    """
+
+    @staticmethod
+    def enqueue(subject, message, recipient_list, from_email=None):
+        """Stores the email to be sent by the mail worker.
+
+        Args:
+            subject (str): The subject of the email.
+            message (str): The plain text body of the email.
+            recipient_list (list): The recipient addresses.
+            from_email (str): The sender address, DEFAULT_FROM_EMAIL if not
+            given.
+
+        Returns:
+            OutgoingEmail: The queued email.
+        """
+        return OutgoingEmail.objects.create(
+            subject=subject,
+            body=message,
+            from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+            recipients=list(recipient_list),
+        )
+
+    @staticmethod
+    def get_retry_delay(attempts):
+        """Returns the delay before the next attempt to send an email."""
+        delay = MAIL_RETRY_DELAY * 2 ** (attempts - 1)
+        return timedelta(seconds=min(delay, MAIL_MAX_RETRY_DELAY))
+
+    def claim(self, batch_size=MAIL_BATCH_SIZE):
+        """Claims a batch of the due emails for sending.
+
+        The emails are locked with SKIP LOCKED while they are marked as
+        sending and their attempt is counted, so several workers can run
+        at the same time without claiming an email twice. Emails whose
+        lease expired on their last attempt are marked as failed.
+
+        Args:
+            batch_size (int): The maximum number of emails to claim.
+
+        Returns:
+            list: The claimed emails.
+        """
+        due = OutgoingEmail.objects.filter(
+            status__in=(
+                OutgoingEmail.Status.PENDING,
+                OutgoingEmail.Status.SENDING,
+            ),
+            send_after__lte=now(),
+        )
+        due.filter(attempts__gte=MAIL_MAX_ATTEMPTS).update(
+            status=OutgoingEmail.Status.FAILED,
+            last_error="The lease of the last attempt expired.",
+        )
+        with transaction.atomic():
+            emails = list(
+                due.filter(attempts__lt=MAIL_MAX_ATTEMPTS)
+                .select_for_update(skip_locked=True)
+                .order_by("send_after")[:batch_size]
+            )
+            if emails:
+                OutgoingEmail.objects.filter(
+                    pk__in=[email.pk for email in emails]
+                ).update(
+                    status=OutgoingEmail.Status.SENDING,
+                    attempts=F("attempts") + 1,
+                    send_after=now() + timedelta(seconds=MAIL_LEASE),
+                )
+        for email in emails:
+            email.attempts += 1
+        return emails
+
+    def send_pending(self, batch_size=MAIL_BATCH_SIZE):
+        """Sends a batch of the pending emails that are due.
+
+        Every email is updated as soon as it is sent or has failed, so a
+        worker that dies mid-batch only sends the rest of the batch again.
+
+        Args:
+            batch_size (int): The maximum number of emails to send.
+
+        Returns:
+            tuple: The numbers of processed and sent emails.
+        """
+        emails = self.claim(batch_size)
+        if not emails:
+            return 0, 0
+        connection = get_connection()
+        try:
+            connection.open()
+        except Exception as error:
+            for email in emails:
+                self._fail(email, error)
+            OutgoingEmail.objects.bulk_update(emails, UPDATE_FIELDS)
+        else:
+            try:
+                for email in emails:
+                    self._send(email, connection)
+                    email.save(update_fields=UPDATE_FIELDS)
+            finally:
+                connection.close()
+        sent = sum(
+            email.status == OutgoingEmail.Status.SENT for email in emails
+        )
+        return len(emails), sent
+
+    def _send(self, email, connection):
+        """Sends the email over the open connection."""
+        try:
+            EmailMessage(
+                subject=email.subject,
+                body=email.body,
+                from_email=email.from_email,
+                to=email.recipients,
+                connection=connection,
+            ).send()
+        except Exception as error:
+            self._fail(email, error)
+            return
+        email.status = OutgoingEmail.Status.SENT
+        email.sent = now()
+        email.last_error = ""
+
+    def _fail(self, email, error):
+        """Records the failed attempt and schedules the next one."""
+        email.last_error = f"{type(error).__name__}: {error}"
+        if email.attempts >= MAIL_MAX_ATTEMPTS:
+            email.status = OutgoingEmail.Status.FAILED
+        else:
+            email.status = OutgoingEmail.Status.PENDING
+            email.send_after = now() + self.get_retry_delay(email.attempts)
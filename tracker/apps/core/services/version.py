@@ -0,0 +1,52 @@
+from time import time
+
+from django.core.cache import cache
+
+DATA_VERSION_KEY = "data_version:{}"
+
+
+class CacheVersion:
+    """Per-user version of cached data.
+
+    Cached entries are stored under keys containing the version, so
+    bumping the version makes all of them unreachable and they simply
+    expire. Every version is a new timestamp rather than a counter, so if
+    the version key is evicted, the next version still differs from the
+    versions entries were stored under, and no stale entry is read again.
+
+    Args:
+        key (str): The cache key of the version, formatted with the user
+        id.
+    """
+
+    def __init__(self, key):
+        self.key = key
+
+    def get_key(self, user_id):
+        """Returns the cache key of the version of the user."""
+        return self.key.format(user_id)
+
+    def get(self, user_id):
+        """Returns the version of the user as a UNIX timestamp."""
+        return cache.get_or_set(self.get_key(user_id), time, None)
+
+    async def aget(self, user_id):
+        """Async version of get()."""
+        return await cache.aget_or_set(self.get_key(user_id), time, None)
+
+    def bump(self, user_id):
+        """Switches the user to a new version."""
+        cache.set(self.get_key(user_id), time(), None)
+
+
+class DataVersion(CacheVersion):
+    """Per-user stamp of the last change to the user's data.
+
+    The stamp is the time of the last write to the time entries, projects
+    or clients of the user, and serves as the validator of conditional
+    GET requests. If the stamp is evicted from the cache, a new one is
+    started, which only costs the clients one full response.
+    """
+
+    def __init__(self):
+        super().__init__(DATA_VERSION_KEY)
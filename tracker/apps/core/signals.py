@@ -0,0 +1,30 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.client.models import Client
+from apps.core.services.version import DataVersion
+from apps.dashboard.models import Time
+from apps.profile.models import User
+from apps.project.models import Project
+
+
+@receiver(post_save, sender=Time)
+@receiver(post_delete, sender=Time)
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+@receiver(post_save, sender=Client)
+@receiver(post_delete, sender=Client)
+def bump_data_version(sender, instance, **kwargs):
+    """Marks the data of the owner as changed once the write is committed,
+    so a concurrent request cannot store the old data under the new stamp.
+    """
+    transaction.on_commit(lambda: DataVersion().bump(instance.user_id))
+
+
+@receiver(post_save, sender=User)
+def bump_user_data_version(sender, instance, **kwargs):
+    """Marks the pages of the user as changed, e.g. the user name in the
+    header.
+    """
+    transaction.on_commit(lambda: DataVersion().bump(instance.pk))
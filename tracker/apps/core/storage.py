@@ -0,0 +1,66 @@
+import gzip
+
+import brotli
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+
+COMPRESSIBLE_EXTENSIONS = (
+    ".css",
+    ".js",
+    ".map",
+    ".svg",
+    ".json",
+    ".txt",
+    ".html",
+    ".xml",
+    ".ico",
+)
+COMPRESS_MIN_SIZE = 256
+COMPRESS_MIN_RATIO = 0.95
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """Static files storage with content hashes in the file names and
+    precompressed gzip and brotli variants.
+
+    The variants are written next to the files by collectstatic, so the
+    gateway serves them with gzip_static and brotli_static without
+    compressing on every request. A variant is only kept when it is
+    noticeably smaller than the original file.
+    """
+
+    def post_process(self, paths, dry_run=False, **options):
+        names = set()
+        for name, hashed_name, processed in super().post_process(
+            paths, dry_run, **options
+        ):
+            yield name, hashed_name, processed
+            if not isinstance(processed, Exception):
+                names.update((name, hashed_name))
+        if dry_run:
+            return
+        names.add(self.manifest_name)
+        for name in sorted(names):
+            if name.endswith(COMPRESSIBLE_EXTENSIONS):
+                self.compress(name)
+
+    def compress(self, name):
+        """Writes the gzip and brotli variants of the stored file.
+
+        Args:
+            name (str): The name of the file in the storage.
+        """
+        with self.open(name) as file:
+            content = file.read()
+        if len(content) < COMPRESS_MIN_SIZE:
+            return
+        variants = {
+            ".gz": gzip.compress(content, compresslevel=9, mtime=0),
+            ".br": brotli.compress(content, quality=11),
+        }
+        for suffix, compressed in variants.items():
+            path = self.path(name + suffix)
+            if len(compressed) < len(content) * COMPRESS_MIN_RATIO:
+                with open(path, "wb") as file:
+                    file.write(compressed)
+            elif self.exists(name + suffix):
+                self.delete(name + suffix)
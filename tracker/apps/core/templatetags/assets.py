@@ -0,0 +1,39 @@
+from django import template
+from django.conf import settings
+from django.templatetags.static import static
+from django.utils.html import format_html
+from django_bootstrap5.templatetags.django_bootstrap5 import (
+    bootstrap_css,
+    bootstrap_javascript,
+)
+
+BOOTSTRAP_CSS = "vendor/bootstrap/bootstrap.min.css"
+BOOTSTRAP_JAVASCRIPT = "vendor/bootstrap/bootstrap.bundle.min.js"
+
+register = template.Library()
+
+
+@register.simple_tag
+def bootstrap_assets():
+    """Returns the tags loading the bootstrap CSS and JavaScript.
+
+    With BOOTSTRAP_ASSETS = "cdn" the files are loaded from the CDN
+    configured in BOOTSTRAP5. Otherwise the vendored copies are served from
+    the static files under their hashed names, announced with preload hints
+    and the script is deferred, so the first paint does not wait for a
+    third-party host.
+    """
+    if settings.BOOTSTRAP_ASSETS == "cdn":
+        return bootstrap_css() + bootstrap_javascript()
+    css = static(BOOTSTRAP_CSS)
+    javascript = static(BOOTSTRAP_JAVASCRIPT)
+    return format_html(
+        '<link rel="preload" href="{}" as="style">\n'
+        '<link rel="preload" href="{}" as="script">\n'
+        '<link rel="stylesheet" href="{}">\n'
+        '<script src="{}" defer></script>',
+        css,
+        javascript,
+        css,
+        javascript,
+    )
@@ -0,0 +1,78 @@
+from datetime import time
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils.timezone import now
+
+from apps.client.models import Client
+from apps.dashboard.models import Time
+from apps.dashboard.services.rollup import DailyTotalProcessor
+from apps.profile.models import User
+from apps.project.models import Project
+
+TEST_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+TEST_STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+    },
+}
+
+
+@override_settings(
+    CACHES=TEST_CACHES,
+    STORAGES=TEST_STORAGES,
+    ALLOWED_HOSTS=["testserver"],
+)
+class TrackerTestCase(TestCase):
+    """Test case with a logged-in user owning a client, a project and a
+    few time entries of today, and an empty in-memory cache.
+
+    Attributes:
+        user (User): The logged-in user.
+        other (User): A second user owning the same kind of data.
+    """
+
+    @classmethod
+    def create_data(cls, username):
+        """Creates a user with a client, a project and time entries."""
+        user = User.objects.create_user(
+            username=username,
+            email=f"{username}@example.com",
+            password="password",
+        )
+        client = Client.objects.create(user=user, name=f"{username} client")
+        project = Project.objects.create(
+            user=user, client=client, name=f"{username} project", amount=10
+        )
+        for hour in range(3):
+            Time.objects.create(
+                user=user,
+                project=project,
+                day=now().date(),
+                start=time(hour, 0),
+                stop=time(hour, 20),
+                duration=0,
+            )
+        DailyTotalProcessor.rebuild(user.pk)
+        return user
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = cls.create_data("user")
+        cls.other = cls.create_data("other")
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        cache.clear()
+
+    def assertWithinQueryBudget(self, view_class, url):
+        """Requests the url with a cold cache and asserts that it runs
+        exactly the query_budget of the view.
+        """
+        with self.assertNumQueries(view_class.query_budget):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response
@@ -0,0 +1,58 @@
+from unittest import mock
+
+from django.conf import settings
+from django.core import mail
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils.timezone import now
+
+from apps.core.models import OutgoingEmail
+from apps.core.services.mail import MAIL_MAX_ATTEMPTS, MailOutbox
+from apps.core.testing import TrackerTestCase
+from apps.project.views import ProjectListView
+
+METRICS_MIDDLEWARE = [
+    "apps.core.middleware.QueryMetricsMiddleware",
+    *settings.MIDDLEWARE,
+]
+
+
+@override_settings(MIDDLEWARE=METRICS_MIDDLEWARE)
+class QueryMetricsMiddlewareTest(TrackerTestCase):
+    def test_within_budget(self):
+        with self.assertLogs("apps.core.middleware", "INFO"):
+            response = self.client.get(reverse("project:list"))
+        self.assertIn("Server-Timing", response)
+        self.assertNotIn("X-Query-Budget", response)
+
+    def test_budget_exceeded_is_reported(self):
+        with mock.patch.object(ProjectListView, "query_budget", 0):
+            with self.assertLogs("apps.core.middleware", "WARNING"):
+                response = self.client.get(reverse("project:list"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response["X-Query-Budget"], "exceeded; queries=3; budget=0"
+        )
+
+
+class MailOutboxTest(TestCase):
+    def test_send_pending(self):
+        email = MailOutbox.enqueue("Subject", "Body", ["user@example.com"])
+        self.assertEqual(MailOutbox().send_pending(), (1, 1))
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutgoingEmail.Status.SENT)
+        self.assertEqual(email.attempts, 1)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_expired_leases_count_as_attempts(self):
+        email = MailOutbox.enqueue("Subject", "Body", ["user@example.com"])
+        outbox = MailOutbox()
+        for attempt in range(1, MAIL_MAX_ATTEMPTS + 1):
+            self.assertEqual(outbox.claim(), [email])
+            email.refresh_from_db()
+            self.assertEqual(email.attempts, attempt)
+            # The worker dies and the lease expires.
+            OutgoingEmail.objects.update(send_after=now())
+        self.assertEqual(outbox.claim(), [])
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutgoingEmail.Status.FAILED)
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+
+from apps.core.services.version import DataVersion
+from apps.dashboard.services.processor import TimeProcessor
+from apps.dashboard.services.rollup import DailyTotalProcessor
+
+BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    """Fills the minutes of time entries saved before the database
+    calculated them, then rebuilds the daily totals of their users.
+
+    The entries are updated in short batches, so the command can run
+    while the application serves requests. Entries that already have
+    their minutes are skipped, so it is safe to run repeatedly.
+    """
+
+    help = "Fill the minutes of existing time entries in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help="Number of time entries updated per UPDATE.",
+        )
+        parser.add_argument(
+            "--delay",
+            type=float,
+            default=0,
+            help="Pause between batches in seconds.",
+        )
+
+    def handle(self, *args, **options):
+        updated, user_ids = TimeProcessor.fill_minutes(
+            options["batch_size"], options["delay"]
+        )
+        for user_id in user_ids:
+            DailyTotalProcessor.rebuild(user_id)
+            DataVersion().bump(user_id)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Filled {updated} time entries, "
+                f"rebuilt the daily totals of {len(user_ids)} users."
+            )
+        )
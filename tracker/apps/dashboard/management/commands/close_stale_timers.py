@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from apps.dashboard.services.processor import TimeProcessor
+
+BATCH_SIZE = 500
+
+
+class Command(BaseCommand):
+    """Closes the timers that were left open on previous days.
+
+    Intended to run shortly after midnight, so that requests do not have
+    to close stale timers themselves.
+    """
+
+    help = "Close open time entries of all users left from previous days."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help="Number of time entries closed per UPDATE.",
+        )
+
+    def handle(self, *args, **options):
+        closed = TimeProcessor().close_stale_timers(options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Closed {closed} timers."))
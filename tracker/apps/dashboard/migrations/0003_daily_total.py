@@ -0,0 +1,89 @@
+# Generated by Django 4.2.4 on 2026-10-18 13:21
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Sum
+
+
+def fill_daily_totals(apps, schema_editor):
+    Time = apps.get_model("dashboard", "Time")
+    DailyTotal = apps.get_model("dashboard", "DailyTotal")
+    totals = (
+        Time.objects.filter(stop__isnull=False)
+        .values("user_id", "project_id", "day")
+        .annotate(total=Sum("duration"))
+        .order_by()
+    )
+    DailyTotal.objects.bulk_create(
+        (
+            DailyTotal(
+                user_id=row["user_id"],
+                project_id=row["project_id"],
+                day=row["day"],
+                duration=row["total"] or 0,
+            )
+            for row in totals.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("project", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("dashboard", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyTotal",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField(verbose_name="Day")),
+                (
+                    "duration",
+                    models.PositiveIntegerField(default=0, verbose_name="Duration"),
+                ),
+                (
+                    "project",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="project.project",
+                        verbose_name="Project",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="User",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Daily Total",
+                "verbose_name_plural": "Daily Totals",
+                "ordering": ("day",),
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="dailytotal",
+            constraint=models.UniqueConstraint(
+                fields=("user", "project", "day"), name="unique_daily_total"
+            ),
+        ),
+        migrations.RunPython(fill_daily_totals, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.4 on 2026-10-18 13:22
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("dashboard", "0003_daily_total"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="time",
+            index=models.Index(
+                fields=["user", "day", "start"], name="time_user_day_start_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="time",
+            index=models.Index(
+                condition=models.Q(("stop__isnull", True)),
+                fields=["user"],
+                name="time_user_active_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="time",
+            index=models.Index(
+                fields=["user", "project", "day"], name="time_user_project_day_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,82 @@
+# Generated by Django 4.2.4 on 2026-10-18 13:40
+
+from datetime import datetime, time
+
+from django.contrib.postgres.operations import RemoveIndexConcurrently
+from django.db import migrations, models
+from django.db.models import Q, Sum
+
+DAY_END = time(23, 59)
+
+
+def get_duration(day, start, stop):
+    diff = datetime.combine(day, stop) - datetime.combine(day, start)
+    hours, remainder = divmod(diff.total_seconds(), 3600)
+    minutes, _ = divmod(remainder, 60)
+    return hours + 1 if minutes > 29 else hours
+
+
+def close_extra_active_timers(apps, schema_editor):
+    """Leaves only the latest open timer of each user running."""
+    Time = apps.get_model("dashboard", "Time")
+    DailyTotal = apps.get_model("dashboard", "DailyTotal")
+    latest = None
+    for timer in Time.objects.filter(stop=None).order_by(
+        "user_id", "-day", "-start"
+    ):
+        if latest is None or latest.user_id != timer.user_id:
+            latest = timer
+            continue
+        timer.stop = latest.start if timer.day == latest.day else DAY_END
+        timer.duration = get_duration(timer.day, timer.start, timer.stop)
+        timer.save(update_fields=("stop", "duration"))
+        lookup = {
+            "user_id": timer.user_id,
+            "project_id": timer.project_id,
+            "day": timer.day,
+        }
+        total = Time.objects.filter(stop__isnull=False, **lookup).aggregate(
+            Sum("duration")
+        )["duration__sum"]
+        DailyTotal.objects.update_or_create(
+            defaults={"duration": total}, **lookup
+        )
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("dashboard", "0004_time_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            close_extra_active_timers,
+            migrations.RunPython.noop,
+            atomic=True,
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name="time",
+                    constraint=models.UniqueConstraint(
+                        condition=Q(("stop__isnull", True)),
+                        fields=("user",),
+                        name="unique_active_timer",
+                    ),
+                ),
+            ],
+            database_operations=[
+                migrations.RunSQL(
+                    'CREATE UNIQUE INDEX CONCURRENTLY "unique_active_timer" '
+                    'ON "dashboard_time" ("user_id") WHERE "stop" IS NULL',
+                    'DROP INDEX CONCURRENTLY "unique_active_timer"',
+                ),
+            ],
+        ),
+        RemoveIndexConcurrently(
+            model_name="time",
+            name="time_user_active_idx",
+        ),
+    ]
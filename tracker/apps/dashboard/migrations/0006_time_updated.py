@@ -0,0 +1,17 @@
+# Generated by Django 4.2.4 on 2026-10-18 13:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("dashboard", "0005_unique_active_timer"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="time",
+            name="updated",
+            field=models.DateTimeField(auto_now=True, verbose_name="Updated"),
+        ),
+    ]
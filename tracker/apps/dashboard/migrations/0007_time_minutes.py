@@ -0,0 +1,71 @@
+# Generated by Django 4.2.4 on 2026-10-18 13:53
+
+from django.db import migrations, models
+
+CREATE_TRIGGER = """
+CREATE FUNCTION dashboard_time_minutes() RETURNS trigger AS $$
+BEGIN
+    NEW.minutes := FLOOR(EXTRACT(EPOCH FROM NEW.stop - NEW.start) / 60);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER dashboard_time_minutes
+    BEFORE INSERT OR UPDATE OF start, stop ON dashboard_time
+    FOR EACH ROW EXECUTE FUNCTION dashboard_time_minutes();
+"""
+
+DROP_TRIGGER = """
+DROP TRIGGER dashboard_time_minutes ON dashboard_time;
+DROP FUNCTION dashboard_time_minutes();
+"""
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("dashboard", "0006_time_updated"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddField(
+                    model_name="time",
+                    name="minutes",
+                    field=models.PositiveIntegerField(
+                        blank=True,
+                        editable=False,
+                        null=True,
+                        verbose_name="Minutes",
+                    ),
+                ),
+            ],
+            database_operations=[
+                migrations.RunSQL(
+                    [
+                        'ALTER TABLE "dashboard_time" '
+                        'ADD COLUMN "minutes" integer NULL',
+                        'ALTER TABLE "dashboard_time" '
+                        'ADD CONSTRAINT "dashboard_time_minutes_check" '
+                        'CHECK ("minutes" >= 0) NOT VALID',
+                    ],
+                    'ALTER TABLE "dashboard_time" DROP COLUMN "minutes"',
+                ),
+            ],
+        ),
+        migrations.RunSQL(
+            'ALTER TABLE "dashboard_time" '
+            'VALIDATE CONSTRAINT "dashboard_time_minutes_check"',
+            migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(CREATE_TRIGGER, DROP_TRIGGER),
+        migrations.AddField(
+            model_name="dailytotal",
+            name="minutes",
+            field=models.PositiveIntegerField(
+                default=0, verbose_name="Minutes"
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.4 on 2026-10-18 15:10
+
+from django.db import migrations, models
+from django.db.models import Q
+
+DELETE_DUPLICATES = """
+DELETE FROM dashboard_dailytotal a
+USING dashboard_dailytotal b
+WHERE a.project_id IS NULL AND b.project_id IS NULL
+  AND a.user_id = b.user_id AND a.day = b.day AND a.id > b.id
+"""
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("dashboard", "0007_time_minutes"),
+    ]
+
+    operations = [
+        migrations.RunSQL(DELETE_DUPLICATES, migrations.RunSQL.noop),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name="dailytotal",
+                    constraint=models.UniqueConstraint(
+                        condition=Q(("project__isnull", True)),
+                        fields=("user", "day"),
+                        name="unique_daily_total_no_project",
+                    ),
+                ),
+            ],
+            database_operations=[
+                migrations.RunSQL(
+                    "CREATE UNIQUE INDEX CONCURRENTLY "
+                    '"unique_daily_total_no_project" '
+                    'ON "dashboard_dailytotal" ("user_id", "day") '
+                    'WHERE "project_id" IS NULL',
+                    'DROP INDEX CONCURRENTLY "unique_daily_total_no_project"',
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.4 on 2026-10-18 15:40
+
+from django.db import migrations, models
+
+FILL_ROUNDED_MINUTES = """
+UPDATE dashboard_dailytotal d
+SET hour_minutes = t.hour_minutes, quarter_minutes = t.quarter_minutes
+FROM (
+    SELECT user_id, project_id, day,
+           SUM((minutes + 30) / 60 * 60) AS hour_minutes,
+           SUM((minutes + 7) / 15 * 15) AS quarter_minutes
+    FROM dashboard_time
+    WHERE stop IS NOT NULL AND minutes IS NOT NULL
+    GROUP BY user_id, project_id, day
+) t
+WHERE d.user_id = t.user_id AND d.day = t.day
+  AND d.project_id IS NOT DISTINCT FROM t.project_id
+"""
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("dashboard", "0008_unique_daily_total_no_project"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dailytotal",
+            name="hour_minutes",
+            field=models.PositiveIntegerField(
+                default=0, verbose_name="Minutes rounded to hours"
+            ),
+        ),
+        migrations.AddField(
+            model_name="dailytotal",
+            name="quarter_minutes",
+            field=models.PositiveIntegerField(
+                default=0, verbose_name="Minutes rounded to 15 minutes"
+            ),
+        ),
+        migrations.RunSQL(FILL_ROUNDED_MINUTES, migrations.RunSQL.noop),
+    ]
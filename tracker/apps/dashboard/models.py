@@ -1,6 +1,6 @@
 from django.core.validators import MaxValueValidator
 from django.db import models
-from django.db.models import DateField
+from django.db.models import DateField, Q
 from django.utils.timezone import now
 
 from apps.core.constants import LENGTH_STR
@@ -47,11 +47,94 @@ class Time(models.Model):
         blank=True,
         null=True,
     )
+    # Set by the dashboard_time_minutes trigger from start and stop.
+    minutes = models.PositiveIntegerField(
+        verbose_name="Minutes",
+        blank=True,
+        null=True,
+        editable=False,
+    )
+    updated = models.DateTimeField(
+        verbose_name="Updated",
+        auto_now=True,
+    )
 
     class Meta:
         verbose_name = "Time"
         verbose_name_plural = "Time"
         ordering = ("day",)
+        indexes = (
+            models.Index(
+                fields=("user", "day", "start"),
+                name="time_user_day_start_idx",
+            ),
+            models.Index(
+                fields=("user", "project", "day"),
+                name="time_user_project_day_idx",
+            ),
+        )
+        constraints = (
+            models.UniqueConstraint(
+                fields=("user",),
+                condition=Q(stop__isnull=True),
+                name="unique_active_timer",
+            ),
+        )
 
     def __str__(self):
         return self.description[:LENGTH_STR]
+
+
+class DailyTotal(models.Model):
+    user = models.ForeignKey(
+        User,
+        verbose_name="User",
+        on_delete=models.CASCADE,
+    )
+    project = models.ForeignKey(
+        Project,
+        verbose_name="Project",
+        on_delete=models.CASCADE,
+        blank=True,
+        null=True,
+    )
+    day = DateField(
+        verbose_name="Day",
+    )
+    duration = models.PositiveIntegerField(
+        verbose_name="Duration",
+        default=0,
+    )
+    minutes = models.PositiveIntegerField(
+        verbose_name="Minutes",
+        default=0,
+    )
+    # The minutes of the entries rounded one by one, see DurationRounding.
+    hour_minutes = models.PositiveIntegerField(
+        verbose_name="Minutes rounded to hours",
+        default=0,
+    )
+    quarter_minutes = models.PositiveIntegerField(
+        verbose_name="Minutes rounded to 15 minutes",
+        default=0,
+    )
+
+    class Meta:
+        verbose_name = "Daily Total"
+        verbose_name_plural = "Daily Totals"
+        ordering = ("day",)
+        constraints = (
+            models.UniqueConstraint(
+                fields=("user", "project", "day"),
+                name="unique_daily_total",
+            ),
+            # NULLs are distinct in the constraint above.
+            models.UniqueConstraint(
+                fields=("user", "day"),
+                condition=Q(project__isnull=True),
+                name="unique_daily_total_no_project",
+            ),
+        )
+
+    def __str__(self):
+        return f"{self.day} {self.project or '----'}: {self.duration}"
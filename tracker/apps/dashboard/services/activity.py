@@ -0,0 +1,81 @@
+from django.db.models import Count, IntegerField, Max, OuterRef, Subquery, Sum
+from django.utils.timezone import now
+
+from apps.dashboard.models import DailyTotal
+from apps.project.models import Project
+
+
+class ActivityAnnotator:
+    """Annotates projects or clients with the time tracked on them.
+
+    Every value is a correlated subquery over the daily totals, so the
+    list stays a single query and PostgreSQL evaluates the subqueries only
+    for the rows of the page, however many projects the user has. The
+    subqueries use the (user, project, day) index of the daily totals.
+
+    Args:
+        user (User): The owner of the projects or clients.
+    """
+
+    def __init__(self, user):
+        self.user = user
+
+    def get_totals(self, lookup):
+        """Returns the daily totals grouped by the lookup of the outer
+        object.
+
+        Args:
+            lookup (str): The path from a daily total to the outer object,
+            e.g. "project" or "project__client".
+        """
+        return (
+            DailyTotal.objects.filter(
+                user=self.user, **{lookup: OuterRef("pk")}
+            )
+            .order_by()
+            .values(lookup)
+        )
+
+    def annotate(self, queryset, lookup):
+        """Adds total_minutes, month_minutes and last_day to the queryset.
+
+        Args:
+            queryset (QuerySet): The projects or clients of the user.
+            lookup (str): The path from a daily total to the objects.
+        """
+        totals = self.get_totals(lookup)
+        month = now().date().replace(day=1)
+        return queryset.annotate(
+            total_minutes=Subquery(
+                totals.annotate(minutes=Sum("minutes")).values("minutes"),
+                output_field=IntegerField(),
+            ),
+            month_minutes=Subquery(
+                totals.filter(day__gte=month)
+                .annotate(minutes=Sum("minutes"))
+                .values("minutes"),
+                output_field=IntegerField(),
+            ),
+            last_day=Subquery(
+                totals.annotate(last_day=Max("day")).values("last_day")
+            ),
+        )
+
+    def annotate_projects(self, queryset):
+        """Adds the activity of every project to the queryset."""
+        return self.annotate(queryset, "project")
+
+    def annotate_clients(self, queryset):
+        """Adds the activity and the project count of every client to the
+        queryset.
+        """
+        return self.annotate(queryset, "project__client").annotate(
+            project_count=Subquery(
+                Project.objects.filter(user=self.user, client=OuterRef("pk"))
+                .order_by()
+                .values("client")
+                .annotate(count=Count("pk"))
+                .values("count"),
+                output_field=IntegerField(),
+            )
+        )
@@ -1,8 +1,20 @@
+from time import sleep
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, TimeField, Value
+from django.db.models.functions import Now
 from django.utils.datetime_safe import datetime
 from django.utils.timezone import now
 
 from apps.core.constants import DAY_END
+from apps.core.functions import Minutes, RoundedHours
+from apps.core.services.version import DataVersion
 from apps.dashboard.models import Time
+from apps.dashboard.services.rollup import DailyTotalProcessor
+
+ACTIVE_TIMER_KEY = "active_timer:{}"
+ACTIVE_TIMER_TIMEOUT = 300
 
 
 class TimeProcessor:
@@ -24,27 +36,143 @@ class TimeProcessor:
             return hours + 1
         return hours
 
+    @staticmethod
+    def get_active_timer(user):
+        """Returns the open time entry of the user or None.
+
+        The database allows at most one open entry per user, so the lookup
+        is a single indexed query, and its result is cached until the next
+        write to the user's time entries: saves and deletes clear it from
+        the signals of Time, bulk updates where they are issued.
+        """
+        key = ACTIVE_TIMER_KEY.format(user.pk)
+        timer = cache.get(key)
+        if timer is None:
+            timer = Time.objects.filter(user=user, stop=None).first() or False
+            cache.set(key, timer, ACTIVE_TIMER_TIMEOUT)
+        return timer or None
+
+    @staticmethod
+    async def aget_active_timer(user):
+        """Async version of get_active_timer()."""
+        key = ACTIVE_TIMER_KEY.format(user.pk)
+        timer = await cache.aget(key)
+        if timer is None:
+            timer = (
+                await Time.objects.filter(user=user, stop=None).afirst()
+                or False
+            )
+            await cache.aset(key, timer, ACTIVE_TIMER_TIMEOUT)
+        return timer or None
+
+    @staticmethod
+    def clear_active_timer(user_id):
+        """Drops the cached active timer of the user."""
+        cache.delete(ACTIVE_TIMER_KEY.format(user_id))
+
+    def close_timers(self, queryset, stop):
+        """Closes the open time entries of the queryset in one UPDATE.
+
+        The duration is calculated by the database, then the affected
+        daily totals, cached active timers and data versions are refreshed.
+
+        Args:
+            queryset (QuerySet): The time entries to close.
+            stop (time): The stop time to set.
+
+        Returns:
+            int: The number of closed time entries.
+        """
+        with transaction.atomic():
+            timers = list(
+                queryset.filter(stop=None)
+                .select_for_update()
+                .values_list("pk", "user_id", "project_id", "day")
+            )
+            if not timers:
+                return 0
+            stop = Value(stop, output_field=TimeField())
+            Time.objects.filter(pk__in=[pk for pk, *_ in timers]).update(
+                stop=stop,
+                duration=RoundedHours(stop - F("start")),
+                updated=Now(),
+            )
+        for user_id in {user_id for _, user_id, *_ in timers}:
+            self.clear_active_timer(user_id)
+            DataVersion().bump(user_id)
+        for key in {tuple(key) for _, *key in timers}:
+            DailyTotalProcessor().refresh(*key)
+        return len(timers)
+
     def close_old_active_timer(self, user, data):
-        active_timers = Time.objects.filter(user=user, stop=None)
-        if active_timers:
+        timer = self.get_active_timer(user)
+        if timer:
             today = now().date()
-            for timer in active_timers:
-                if timer.day != today or (
-                    data["day"] == today and data["stop"] is None
-                ):
-                    timer.stop = (
-                        DAY_END if timer.day != today else now().time()
-                    )
-                    timer.duration = self.get_duration(
-                        timer.day, timer.start, timer.stop
-                    )
-                    timer.save()
+            timers = Time.objects.filter(pk=timer.pk)
+            if timer.day != today:
+                self.close_timers(timers, DAY_END)
+            elif data["day"] == today and data["stop"] is None:
+                self.close_timers(timers, now().time())
+
+    def close_stale_timers(self, batch_size):
+        """Closes open time entries left from previous days at DAY_END.
+
+        Args:
+            batch_size (int): The number of time entries closed per UPDATE.
+
+        Returns:
+            int: The number of closed time entries.
+        """
+        stale = Time.objects.filter(stop=None, day__lt=now().date())
+        closed = 0
+        while True:
+            pks = list(
+                stale.order_by("pk").values_list("pk", flat=True)[:batch_size]
+            )
+            if not pks:
+                return closed
+            closed += self.close_timers(
+                Time.objects.filter(pk__in=pks), DAY_END
+            )
+
+    @staticmethod
+    def fill_minutes(batch_size, delay=0):
+        """Fills the minutes of closed time entries saved before they were
+        calculated by the database.
+
+        The entries are walked in primary key order and updated in separate
+        short transactions of batch_size rows, so only the rows of the
+        current batch are locked.
+
+        Args:
+            batch_size (int): The number of time entries updated per UPDATE.
+            delay (float): The pause between batches in seconds.
+
+        Returns:
+            tuple: The number of updated time entries and the ids of their
+            users.
+        """
+        pending = Time.objects.filter(minutes=None, stop__isnull=False)
+        updated = 0
+        user_ids = set()
+        last_pk = 0
+        while True:
+            rows = list(
+                pending.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", "user_id")[:batch_size]
+            )
+            if not rows:
+                return updated, user_ids
+            last_pk = rows[-1][0]
+            user_ids.update(user_id for _, user_id in rows)
+            updated += Time.objects.filter(
+                pk__in=[pk for pk, _ in rows], minutes=None
+            ).update(minutes=Minutes(F("stop") - F("start")))
+            if delay:
+                sleep(delay)
 
     def stop_active_timer(self, user):
-        timer = Time.objects.filter(user=user, stop=None).first()
+        timer = self.get_active_timer(user)
         if timer:
-            timer.stop = now().time()
-            timer.duration = self.get_duration(
-                timer.day, timer.start, timer.stop
-            )
-            timer.save()
+            self.close_timers(Time.objects.filter(pk=timer.pk), now().time())
@@ -0,0 +1,130 @@
+from django.db import transaction
+from django.db.models import Sum
+from django.dispatch import Signal
+
+from apps.core.functions import RoundedMinutes
+from apps.dashboard.models import DailyTotal, Time
+from apps.profile.models import User
+
+# Sent with the user_id and the recalculated days, None for all days.
+daily_totals_changed = Signal()
+# The sums of a bucket by DailyTotal field, rounding the minutes of each
+# entry like the hour and quarter roundings of the reports. They are
+# aliased with a prefix, so the sum of minutes does not shadow the column.
+TOTALS = {
+    "total_duration": Sum("duration"),
+    "total_minutes": Sum("minutes"),
+    "total_hour_minutes": Sum(RoundedMinutes("minutes", 60)),
+    "total_quarter_minutes": Sum(RoundedMinutes("minutes", 15)),
+}
+
+
+def get_fields(totals):
+    """Returns the DailyTotal fields of the aggregated TOTALS."""
+    return {
+        alias.removeprefix("total_"): totals[alias] or 0 for alias in TOTALS
+    }
+
+
+class DailyTotalProcessor:
+    """Keeps the per-user/per-project/per-day rollup of closed time entries
+    in sync with the Time table.
+
+    Every write to Time refreshes only the buckets it touches, so the cost
+    of a refresh is bounded by the number of entries in a single day.
+    Refreshes of a user are serialized by a lock on the user row, so two
+    concurrent refreshes cannot both insert a bucket.
+    Every recalculation sends daily_totals_changed, so apps caching data
+    derived from the totals can drop it.
+    """
+
+    @staticmethod
+    def lock(user_id):
+        """Locks the user row until the end of the current transaction."""
+        list(
+            User.objects.select_for_update()
+            .filter(pk=user_id)
+            .values_list("pk", flat=True)
+        )
+
+    @staticmethod
+    def refresh(user_id, project_id, day):
+        """Recalculates one (user, project, day) bucket.
+
+        Args:
+            user_id (int): The owner of the time entries.
+            project_id (int | None): The project of the time entries.
+            day (date): The day of the time entries.
+        """
+        lookup = {"user_id": user_id, "project_id": project_id, "day": day}
+        with transaction.atomic():
+            DailyTotalProcessor.lock(user_id)
+            total = Time.objects.filter(
+                stop__isnull=False, **lookup
+            ).aggregate(**TOTALS)
+            DailyTotal.objects.filter(**lookup).delete()
+            if total["total_duration"] is not None:
+                DailyTotal.objects.create(**get_fields(total), **lookup)
+        daily_totals_changed.send(DailyTotal, user_id=user_id, days={day})
+
+    def refresh_for(self, time):
+        """Recalculates the bucket the given time entry belongs to."""
+        self.refresh(time.user_id, time.project_id, time.day)
+
+    @staticmethod
+    def replace(user_id, batch_size=1000, **lookup):
+        """Recalculates the buckets of the user matching the lookup with
+        one aggregate query.
+
+        Args:
+            user_id (int): The owner of the time entries.
+            batch_size (int): The number of buckets inserted per query.
+            **lookup: The filter of the days or projects to recalculate.
+        """
+        totals = (
+            Time.objects.filter(user_id=user_id, stop__isnull=False, **lookup)
+            .values("project_id", "day")
+            .annotate(**TOTALS)
+            .order_by()
+        )
+        with transaction.atomic():
+            DailyTotalProcessor.lock(user_id)
+            DailyTotal.objects.filter(user_id=user_id, **lookup).delete()
+            DailyTotal.objects.bulk_create(
+                (
+                    DailyTotal(
+                        user_id=user_id,
+                        project_id=row["project_id"],
+                        day=row["day"],
+                        **get_fields(row),
+                    )
+                    for row in totals.iterator()
+                ),
+                batch_size=batch_size,
+            )
+
+    @staticmethod
+    def refresh_days(user_id, days):
+        """Recalculates all buckets of the user on the given days, e.g.
+        after bulk writes that bypass refresh().
+
+        Args:
+            user_id (int): The owner of the time entries.
+            days (set): The days of the time entries.
+        """
+        if not days:
+            return
+        DailyTotalProcessor.replace(user_id, day__in=days)
+        daily_totals_changed.send(DailyTotal, user_id=user_id, days=days)
+
+    @staticmethod
+    def rebuild(user_id, batch_size=1000):
+        """Recalculates all buckets of the user with one aggregate query,
+        e.g. after bulk inserts that bypass refresh().
+
+        Args:
+            user_id (int): The owner of the time entries.
+            batch_size (int): The number of buckets inserted per query.
+        """
+        DailyTotalProcessor.replace(user_id, batch_size)
+        daily_totals_changed.send(DailyTotal, user_id=user_id, days=None)
@@ -0,0 +1,17 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.dashboard.models import Time
+from apps.dashboard.services.processor import TimeProcessor
+
+
+@receiver(post_save, sender=Time)
+@receiver(post_delete, sender=Time)
+def clear_active_timer(sender, instance, **kwargs):
+    """Drops the cached active timer of the owner once the write is
+    committed, including writes from the admin and cascade deletes.
+    """
+    transaction.on_commit(
+        lambda: TimeProcessor.clear_active_timer(instance.user_id)
+    )
@@ -0,0 +1,78 @@
+import re
+from datetime import time, timedelta
+
+from django.db import connection
+from django.urls import reverse
+from django.utils.timezone import now
+
+from apps.core.testing import TrackerTestCase
+from apps.dashboard.models import Time
+from apps.dashboard.views import DashboardListView
+
+INDEX_SCAN = re.compile(r"Index (?:Only )?Scan (?:using|on) (\w+)")
+
+
+class DashboardListViewTest(TrackerTestCase):
+    def test_query_budget(self):
+        response = self.assertWithinQueryBudget(
+            DashboardListView, reverse("dashboard:dashboard")
+        )
+        self.assertEqual(len(response.context["page_obj"]), 3)
+
+
+class QueryPlanTest(TrackerTestCase):
+    """Checks that the hot Time queries are answered by the expected
+    index.
+
+    Sequential scans are disabled and the table is analyzed, so the plans
+    of the small test table are those of a large one.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        project = cls.user.project_set.get()
+        Time.objects.bulk_create(
+            Time(
+                user=user,
+                project=project if day % 2 else None,
+                day=now().date() - timedelta(days=day),
+                start=time(hour, 0),
+                stop=time(hour, 30),
+                duration=1,
+            )
+            for user in (cls.user, cls.other)
+            for day in range(1, 200)
+            for hour in range(8, 12)
+        )
+        Time.objects.create(
+            user=cls.user, day=now().date(), start=time(12, 0)
+        )
+
+    def get_used_indexes(self, queryset):
+        """Returns the names of the indexes in the plan of the queryset."""
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE dashboard_time")
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        return set(INDEX_SCAN.findall(queryset.explain()))
+
+    def test_hot_queries_use_expected_index(self):
+        today = now().date()
+        time = Time.objects.filter(user=self.user)
+        closed = time.filter(stop__isnull=False, day__range=(today, today))
+        for name, queryset, index in (
+            (
+                "dashboard list",
+                time.filter(day=today).order_by("start"),
+                "time_user_day_start_idx",
+            ),
+            ("active timer", time.filter(stop=None), "unique_active_timer"),
+            ("report by day", closed, "time_user_day_start_idx"),
+            (
+                "report by project",
+                closed.filter(project_id=0),
+                "time_user_project_day_idx",
+            ),
+        ):
+            with self.subTest(name):
+                self.assertEqual(self.get_used_indexes(queryset), {index})
@@ -1,6 +1,8 @@
 from datetime import datetime, timedelta
 
+from asgiref.sync import sync_to_async
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db import IntegrityError, transaction
 from django.shortcuts import redirect
 from django.urls import reverse_lazy
 from django.utils.timezone import now
@@ -8,33 +10,55 @@ from django.views.generic import CreateView, UpdateView, DeleteView
 from django_filters.views import FilterView
 
 from apps.core.constants import CREATE, UPDATE, DELETE
-from apps.core.mixins import UserAccessMixin
+from apps.core.mixins import (
+    AsyncFilterViewMixin,
+    AsyncLoginRequiredMixin,
+    ConditionalGetMixin,
+    KeysetPaginationMixin,
+    UserAccessMixin,
+)
 from apps.dashboard.filters import DashboardFilter
 from apps.dashboard.forms import TimeForm
 from apps.dashboard.models import Time
 from apps.dashboard.services.processor import TimeProcessor
+from apps.dashboard.services.rollup import DailyTotalProcessor
 from apps.project.models import Project
 
 
 TITLE = "Time Entry"
 DASHBOARD = "dashboard:dashboard"
 DELETE_LINK = "dashboard:delete"
+ACTIVE_TIMER_ERROR = "Another timer is already running."
 
 
-class DashboardListView(LoginRequiredMixin, FilterView):
+class DashboardListView(
+    AsyncLoginRequiredMixin,
+    KeysetPaginationMixin,
+    ConditionalGetMixin,
+    AsyncFilterViewMixin,
+    FilterView,
+):
     """View for displaying a paginated list of time entries in the dashboard.
 
+    The handlers are coroutines and query the database with the async ORM.
+    Unless a timer is running, repeated requests are answered with 304 Not
+    Modified until the user's data changes.
+
     Attributes:
         model (Model): The model for which the view is created (Time).
         filterset_class (Filter Set): The filter set class for dashboard
         filtering.
         template_name (str): The name of the template to be rendered.
         paginate_by (int): Number of time entries to display per page.
+        keyset_ordering (tuple): The ordering time entries are paginated by.
+        query_budget (int): The maximum number of queries per GET request.
 
     Methods:
         get_queryset(self): Returns the queryset of time entries associated
         with the logged-in user.
-        get_context_data(self, **kwargs): Returns the context data for
+        ais_not_modified_allowed(self): Returns whether the page may be
+        answered by a 304 response.
+        aget_context_data(self, **kwargs): Returns the context data for
         rendering the template.
         get(self, request, *args, **kwargs): Handles GET requests for
         navigating through time entries.
@@ -46,6 +70,8 @@ class DashboardListView(LoginRequiredMixin, FilterView):
     filterset_class = DashboardFilter
     template_name = "dashboard/dashboard.html"
     paginate_by = 20
+    keyset_ordering = ("day", "start", "id")
+    query_budget = 4
 
     def get_queryset(self):
         """Returns the queryset of time entries associated with the logged-in
@@ -58,10 +84,21 @@ class DashboardListView(LoginRequiredMixin, FilterView):
         )
         return self.queryset
 
-    def get_context_data(self, **kwargs):
+    async def ais_not_modified_allowed(self):
+        """Returns whether the page may be answered by a 304 response.
+
+        The duration of a running timer changes without a write, so the
+        page is always rendered while a timer is running.
+        """
+        return not await TimeProcessor().aget_active_timer(self.request.user)
+
+    async def aget_context_data(self, **kwargs):
         """Returns the context data for rendering the template."""
-        context = super().get_context_data(**kwargs)
-        active_timer = self.queryset.filter(stop=None).first()
+        await self.apaginate_queryset(self.object_list, self.paginate_by)
+        context = await super().aget_context_data(**kwargs)
+        active_timer = await TimeProcessor().aget_active_timer(
+            self.request.user
+        )
         if active_timer:
             context.update(
                 {
@@ -75,7 +112,7 @@ class DashboardListView(LoginRequiredMixin, FilterView):
             )
         return context
 
-    def get(self, request, *args, **kwargs):
+    async def get(self, request, *args, **kwargs):
         """Handles GET requests for navigating through time entries.
 
         Args:
@@ -95,9 +132,10 @@ class DashboardListView(LoginRequiredMixin, FilterView):
             selected_date += timedelta(days=1)
         request.GET = request.GET.copy()
         request.GET["day"] = selected_date.strftime("%Y-%m-%d")
-        return super().get(request, *args, **kwargs)
+        request.GET.pop("direction", None)
+        return await super().get(request, *args, **kwargs)
 
-    def post(self, request, *args, **kwargs):
+    async def post(self, request, *args, **kwargs):
         """Handles POST requests to stop the active timer and redirect
         to the dashboard.
 
@@ -109,7 +147,7 @@ class DashboardListView(LoginRequiredMixin, FilterView):
         Returns:
             HttpResponse: The HTTP response after processing the request.
         """
-        TimeProcessor().stop_active_timer(self.request.user)
+        await sync_to_async(TimeProcessor().stop_active_timer)(request.user)
         return redirect(DASHBOARD)
 
 
@@ -167,19 +205,31 @@ class DashboardCreateView(DashboardView, LoginRequiredMixin, CreateView):
 
         Returns:
             HttpResponse: The HTTP response after successful form processing.
+            If another open timer was saved concurrently, the form is
+            returned with an error.
         """
-        form.instance.user = self.request.user
+        user = self.request.user
+        form.instance.user = user
         data = form.cleaned_data
-        TimeProcessor().close_old_active_timer(self.request.user, data)
+        TimeProcessor().close_old_active_timer(user, data)
         if data["stop"]:
             form.instance.duration = TimeProcessor().get_duration(
                 data["day"], data["start"], data["stop"]
             )
-        return super().form_valid(form)
+        try:
+            with transaction.atomic():
+                response = super().form_valid(form)
+        except IntegrityError:
+            form.add_error("stop", ACTIVE_TIMER_ERROR)
+            return self.form_invalid(form)
+        finally:
+            TimeProcessor.clear_active_timer(user.pk)
+        DailyTotalProcessor().refresh_for(self.object)
+        return response
 
     def get_context_data(self, **kwargs):
         """Returns the context data for rendering the template."""
-        context = super().get_context_data()
+        context = super().get_context_data(**kwargs)
         context.update(
             {
                 "title": TITLE,
@@ -194,13 +244,35 @@ class DashboardUpdateView(DashboardCreateView, UserAccessMixin, UpdateView):
     """View for updating an existing time entry.
 
     Methods:
+        form_valid(self, form): Processes the form when it is valid.
         get_context_data(self, **kwargs): Returns the context data for
         rendering the template.
     """
 
+    def form_valid(self, form):
+        """Processes the form when it is valid.
+
+        If the entry was moved to another day or project, the daily total
+        it previously belonged to is recalculated as well.
+
+        Args:
+            form (Form): The valid form instance.
+
+        Returns:
+            HttpResponse: The HTTP response after successful form processing.
+        """
+        response = super().form_valid(form)
+        if {"day", "project"} & set(form.changed_data):
+            DailyTotalProcessor().refresh(
+                self.object.user_id,
+                form.initial["project"],
+                form.initial["day"],
+            )
+        return response
+
     def get_context_data(self, **kwargs):
         """Returns the context data for rendering the template."""
-        context = super().get_context_data()
+        context = super().get_context_data(**kwargs)
         context.update(
             {
                 "action": UPDATE,
@@ -215,9 +287,24 @@ class DashboardDeleteView(DashboardView, UserAccessMixin, DeleteView):
     """View for deleting an existing time entry.
 
     Methods:
+        form_valid(self, form): Deletes the time entry.
         get_context_data(self, **kwargs): Returns the context data for
         rendering the template.
     """
+
+    def form_valid(self, form):
+        """Deletes the time entry and recalculates its daily total.
+
+        Args:
+            form (Form): The valid form instance.
+
+        Returns:
+            HttpResponse: The HTTP response after successful deletion.
+        """
+        response = super().form_valid(form)
+        DailyTotalProcessor().refresh_for(self.object)
+        return response
+
     def get_context_data(self, **kwargs):
         """Returns the context data for rendering the template."""
         context = super().get_context_data()
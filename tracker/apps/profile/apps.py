@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ProfileConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.profile"
+
+    def ready(self):
+        from apps.profile import signals  # noqa: F401
@@ -0,0 +1,16 @@
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.utils.functional import SimpleLazyObject
+
+from apps.profile.services.cache import UserCache
+
+
+class CachedAuthenticationMiddleware(AuthenticationMiddleware):
+    """AuthenticationMiddleware loading request.user through UserCache.
+
+    Requests of a logged-in user then cost no user query while the cached
+    user is valid.
+    """
+
+    def process_request(self, request):
+        super().process_request(request)
+        request.user = SimpleLazyObject(lambda: UserCache().get_user(request))
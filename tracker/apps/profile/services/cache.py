@@ -0,0 +1,50 @@
+from django.conf import settings
+from django.contrib.auth import HASH_SESSION_KEY, SESSION_KEY, get_user
+from django.core.cache import cache
+
+from apps.core.services.version import CacheVersion
+
+AUTH_USER_KEY = "auth_user:{}:{}:{}"
+AUTH_USER_VERSION_KEY = "auth_user_version:{}"
+
+
+class UserCache:
+    """Caches the authenticated user of a session.
+
+    The user is cached by the session auth hash, which changes with the
+    password, and under a version, which is bumped whenever the user is
+    saved or deleted, so a cached user is never older than the
+    database row.
+    """
+
+    version = CacheVersion(AUTH_USER_VERSION_KEY)
+
+    def get_user(self, request):
+        """Returns the user of the request session.
+
+        Falls back to django.contrib.auth.get_user(), which also checks
+        the session auth hash, when the user is not cached.
+
+        Args:
+            request (HttpRequest): The HTTP request object with a session.
+
+        Returns:
+            User: The authenticated user or AnonymousUser.
+        """
+        timeout = settings.AUTH_USER_CACHE_TIMEOUT
+        user_id = request.session.get(SESSION_KEY)
+        session_hash = request.session.get(HASH_SESSION_KEY)
+        if not timeout or user_id is None or session_hash is None:
+            return get_user(request)
+        version = self.version.get(user_id)
+        key = AUTH_USER_KEY.format(user_id, version, session_hash)
+        user = cache.get(key)
+        if user is None:
+            user = get_user(request)
+            if user.is_authenticated:
+                cache.set(key, user, timeout)
+        return user
+
+    def invalidate(self, user_id):
+        """Drops the cached user from all sessions."""
+        self.version.bump(user_id)
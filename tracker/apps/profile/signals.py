@@ -0,0 +1,14 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.profile.models import User
+from apps.profile.services.cache import UserCache
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender, instance, **kwargs):
+    """Drops the cached user, e.g. after ProfileUpdateView or
+    ProfileDeleteView.
+    """
+    UserCache().invalidate(instance.pk)
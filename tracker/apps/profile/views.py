@@ -2,7 +2,6 @@ from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.tokens import default_token_generator
 from django.contrib.sites.shortcuts import get_current_site
-from django.core.mail import send_mail
 from django.shortcuts import render
 from django.urls import reverse_lazy, reverse
 from django.utils.encoding import force_bytes
@@ -17,6 +16,7 @@ from django.views.generic import (
     FormView,
 )
 
+from apps.core.services.mail import MailOutbox
 from apps.profile.forms import (
     RegistrationForm,
     ProfileUpdateForm,
@@ -34,7 +34,7 @@ class SendConfirmEmailMixin:
 
     Methods:
         send_confirm_url(self, email):
-            Sends a confirmation email to the provided email address.
+            Queues a confirmation email to the provided email address.
 
         get_confirm_url(self):
             Generates and returns the confirmation URL.
@@ -45,20 +45,22 @@ class SendConfirmEmailMixin:
     """
 
     def send_confirm_url(self, email):
-        """Sends a confirmation email to the provided email address.
+        """Queues a confirmation email to the provided email address.
+
+        The email is sent by the mail worker, so the request does not wait
+        for the mail server.
 
         Args:
             email (str): The recipient's email address.
         """
         confirm_url = self.get_confirm_url()
-        send_mail(
+        MailOutbox.enqueue(
             subject="Confirm email address.",
             message=(
                 f"Follow the link to activate your account.\n{confirm_url}"
             ),
             from_email=settings.EMAIL_HOST_USER,
             recipient_list=[email],
-            fail_silently=True,
         )
 
     def get_confirm_url(self):
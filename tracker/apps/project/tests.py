@@ -0,0 +1,14 @@
+from django.urls import reverse
+
+from apps.core.testing import TrackerTestCase
+from apps.project.views import ProjectListView
+
+
+class ProjectListViewTest(TrackerTestCase):
+    def test_query_budget(self):
+        response = self.assertWithinQueryBudget(
+            ProjectListView, reverse("project:list")
+        )
+        project = response.context["page_obj"][0]
+        self.assertEqual(project.total_minutes, 60)
+        self.assertEqual(project.month_minutes, 60)
@@ -6,15 +6,16 @@ from django_filters.views import FilterView
 from apps.project.filters import ProjectFilter
 from apps.project.forms import ProjectForm
 from apps.core.constants import CREATE, DELETE, UPDATE
+from apps.dashboard.services.activity import ActivityAnnotator
 from apps.project.models import Project
-from apps.core.mixins import UserAccessMixin
+from apps.core.mixins import KeysetPaginationMixin, UserAccessMixin
 
 TITLE = "Project"
 PROJECT_LIST = "project:list"
 DELETE_LINK = "project:delete"
 
 
-class ProjectListView(LoginRequiredMixin, FilterView):
+class ProjectListView(LoginRequiredMixin, KeysetPaginationMixin, FilterView):
     """View for displaying a paginated list of projects associated with the
     logged-in user.
 
@@ -24,24 +25,28 @@ class ProjectListView(LoginRequiredMixin, FilterView):
         filtering.
         template_name (str): The name of the template to be rendered.
         paginate_by (int): Number of projects to display per page.
+        keyset_ordering (tuple): The ordering projects are paginated by.
+        query_budget (int): The maximum number of queries per GET request.
 
     Methods:
         get_queryset(self): Returns the queryset of projects associated with
         the logged-in user.
         get_filterset_kwargs(self, filterset_class): Returns the keyword
         arguments for instantiating the filter set.
-        get_context_data(self, **kwargs): Returns the context data for
-        rendering the template.
     """
 
     model = Project
     filterset_class = ProjectFilter
     template_name = "project/list.html"
     paginate_by = 10
+    keyset_ordering = ("name", "id")
+    query_budget = 3
 
     def get_queryset(self):
-        """Returns queryset of projects associated with the logged-in user."""
-        return (
+        """Returns queryset of projects associated with the logged-in user,
+        annotated with the time tracked on them.
+        """
+        return ActivityAnnotator(self.request.user).annotate_projects(
             Project.objects.all()
             .select_related("client")
             .filter(user=self.request.user)
@@ -59,15 +64,6 @@ class ProjectListView(LoginRequiredMixin, FilterView):
             kwargs["data"]["status"] = Project.Status.ACTIVE
         return kwargs
 
-    def get_context_data(self, **kwargs):
-        """Returns the context data for rendering the template."""
-        context = super().get_context_data(**kwargs)
-        query_params = self.request.GET.copy()
-        if "page" in query_params:
-            del query_params["page"]
-        context["urlencode"] = query_params.urlencode()
-        return context
-
 
 class ProjectView:
     """Base view for project-related operations.
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ReportConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.report"
+
+    def ready(self):
+        from apps.report import signals  # noqa: F401
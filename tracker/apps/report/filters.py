@@ -1,14 +1,28 @@
 from django.utils.timezone import now
 from django_filters import (
+    ChoiceFilter,
     FilterSet,
     DateFromToRangeFilter,
 )
 from django_filters.widgets import RangeWidget
 
-from apps.dashboard.models import Time
+from apps.dashboard.models import DailyTotal, Time
+from apps.report.services.rounding import ROUNDING_CHOICES
 
 
 class ReportFilter(FilterSet):
+    """Filter set of the report.
+
+    The project and client choices are given per instance, so the class
+    is shared safely between requests and validating or rendering the
+    filter does not query the database. The rounding only selects how the
+    durations of the report are rounded.
+
+    Args:
+        choices (dict): The choices of the project and client filters by
+        filter name.
+    """
+
     day = DateFromToRangeFilter(
         widget=RangeWidget(
             attrs={
@@ -18,6 +32,14 @@ class ReportFilter(FilterSet):
         ),
         required=True,
     )
+    project__client = ChoiceFilter(label="Client")
+    project = ChoiceFilter(label="Project Name")
+    rounding = ChoiceFilter(
+        label="Rounding",
+        choices=ROUNDING_CHOICES,
+        empty_label=None,
+        method="filter_rounding",
+    )
 
     class Meta:
         model = Time
@@ -26,3 +48,19 @@ class ReportFilter(FilterSet):
             "project__client",
             "project",
         )
+
+    def __init__(self, *args, choices=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.choices = choices or {}
+        for name, field_choices in self.choices.items():
+            self.filters[name].extra["choices"] = field_choices
+
+    @staticmethod
+    def filter_rounding(queryset, name, value):
+        """Keeps the queryset, the rounding applies to the durations only."""
+        return queryset
+
+
+class DailyTotalFilter(ReportFilter):
+    class Meta(ReportFilter.Meta):
+        model = DailyTotal
@@ -0,0 +1,59 @@
+from django import forms
+from django.utils.timezone import now
+
+from apps.report.services.rounding import DEFAULT_ROUNDING, ROUNDING_CHOICES
+
+MONTH_FORMAT = "%Y-%m"
+
+
+class MonthInput(forms.DateInput):
+    input_type = "month"
+
+    def __init__(self, attrs=None):
+        super().__init__(attrs, format=MONTH_FORMAT)
+
+
+class EarningsForm(forms.Form):
+    """Form selecting the months and the rounding of the earnings report.
+
+    Without data the report covers the months of the current year.
+    """
+
+    first = forms.DateField(
+        label="From",
+        input_formats=(MONTH_FORMAT,),
+        widget=MonthInput(),
+    )
+    last = forms.DateField(
+        label="To",
+        input_formats=(MONTH_FORMAT,),
+        widget=MonthInput(),
+    )
+    rounding = forms.ChoiceField(
+        label="Rounding",
+        choices=ROUNDING_CHOICES,
+    )
+
+    def __init__(self, data=None, **kwargs):
+        today = now().date()
+        if data is None:
+            data = {
+                "first": f"{today.year}-01",
+                "last": f"{today:{MONTH_FORMAT}}",
+                "rounding": DEFAULT_ROUNDING,
+            }
+        super().__init__(data, **kwargs)
+        for name in ("first", "last"):
+            self.fields[name].widget.attrs["max"] = f"{today:{MONTH_FORMAT}}"
+
+    def clean(self):
+        cleaned_data = super().clean()
+        first = cleaned_data.get("first")
+        last = cleaned_data.get("last")
+        if first and last and first > last:
+            self.add_error(
+                "last", "The last month cannot be before the first one."
+            )
+        if last and last > now().date():
+            self.add_error("last", "The last month cannot be in the future.")
+        return cleaned_data
@@ -0,0 +1,97 @@
+import csv
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.timezone import now
+
+from apps.profile.models import User
+from apps.report.services.earnings import EarningsReport
+from apps.report.services.rounding import DEFAULT_ROUNDING, ROUNDING_STEPS
+
+EARNINGS_HEADER = (
+    "User",
+    "Month",
+    "Client",
+    "Project Name",
+    "Payment type",
+    "Minutes",
+    "Amount",
+    "Revenue",
+)
+
+
+class Command(BaseCommand):
+    """Writes the earnings of all users with billed projects for one month
+    as CSV.
+
+    Intended for the month-end run of the finance team. Closed months are
+    served from the earnings cache, so repeated runs do not query the
+    time entries again.
+    """
+
+    help = "Write the earnings of all users for a month as CSV."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--month",
+            help="Month as YYYY-MM, the previous month by default.",
+        )
+        parser.add_argument(
+            "--rounding",
+            choices=tuple(ROUNDING_STEPS),
+            default=DEFAULT_ROUNDING,
+            help="Rounding of the tracked time.",
+        )
+        parser.add_argument(
+            "--output",
+            help="Path of the CSV file, the standard output by default.",
+        )
+
+    @staticmethod
+    def get_month(value):
+        """Returns the first day of the given or the previous month."""
+        if value is None:
+            return (now().date().replace(day=1) - timedelta(days=1)).replace(
+                day=1
+            )
+        try:
+            return datetime.strptime(value, "%Y-%m").date()
+        except ValueError:
+            raise CommandError(f"Invalid month: {value}, expected YYYY-MM.")
+
+    def write_rows(self, file, month, rounding):
+        """Writes the earnings rows of all users to the file."""
+        report = EarningsReport(rounding)
+        writer = csv.writer(file)
+        writer.writerow(EARNINGS_HEADER)
+        users = (
+            User.objects.filter(project__billing=True)
+            .distinct()
+            .order_by("pk")
+            .values_list("pk", "username")
+        )
+        for user_id, username in users.iterator():
+            for row in report.get_earnings(user_id, month, month):
+                writer.writerow(
+                    (
+                        username,
+                        f"{month:%Y-%m}",
+                        row["client"] or "",
+                        row["project"],
+                        row["payment_type"],
+                        "" if row["minutes"] is None else row["minutes"],
+                        row["amount"],
+                        row["revenue"],
+                    )
+                )
+
+    def handle(self, *args, **options):
+        month = self.get_month(options["month"])
+        if options["output"] is None:
+            self.write_rows(self.stdout, month, options["rounding"])
+            return
+        with open(options["output"], "w", newline="") as file:
+            self.write_rows(file, month, options["rounding"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Earnings for {month:%Y-%m} written.")
+        )
@@ -0,0 +1,66 @@
+from django.core.cache import cache
+
+from apps.client.models import Client
+from apps.core.services.version import CacheVersion
+from apps.project.models import Project
+
+REPORT_CHOICES_KEY = "report_choices:{}:{}"
+REPORT_CHOICES_VERSION_KEY = "report_choices_version:{}"
+REPORT_CHOICES_TIMEOUT = 60 * 60 * 24
+
+
+class ReportChoices:
+    """Provides the project and client choices of the report filter.
+
+    The choices are cached per user under a version, which is bumped
+    whenever a project or client of the user changes, so stale entries are
+    never read and simply expire.
+    """
+
+    version = CacheVersion(REPORT_CHOICES_VERSION_KEY)
+
+    @staticmethod
+    def get_querysets(user_id):
+        """Returns the choices querysets by filter name."""
+        return {
+            "project": Project.objects.filter(
+                user_id=user_id, payment_type=Project.Payment.HOUR
+            ).values_list("pk", "name"),
+            "project__client": Client.objects.filter(
+                user_id=user_id
+            ).values_list("pk", "name"),
+        }
+
+    def get_choices(self, user):
+        """Returns the choices of the user by filter name.
+
+        Args:
+            user (User): The owner of the projects and clients.
+        """
+        version = self.version.get(user.pk)
+        key = REPORT_CHOICES_KEY.format(user.pk, version)
+        choices = cache.get(key)
+        if choices is None:
+            choices = {
+                name: list(queryset)
+                for name, queryset in self.get_querysets(user.pk).items()
+            }
+            cache.set(key, choices, REPORT_CHOICES_TIMEOUT)
+        return choices
+
+    async def aget_choices(self, user):
+        """Async version of get_choices()."""
+        version = await self.version.aget(user.pk)
+        key = REPORT_CHOICES_KEY.format(user.pk, version)
+        choices = await cache.aget(key)
+        if choices is None:
+            choices = {
+                name: [choice async for choice in queryset]
+                for name, queryset in self.get_querysets(user.pk).items()
+            }
+            await cache.aset(key, choices, REPORT_CHOICES_TIMEOUT)
+        return choices
+
+    def invalidate(self, user_id):
+        """Switches the user to a new choices version."""
+        self.version.bump(user_id)
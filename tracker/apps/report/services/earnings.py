@@ -0,0 +1,186 @@
+from datetime import date
+
+from django.core.cache import cache
+from django.db.models import Case, DateField, DecimalField, F, Sum, When
+from django.db.models.functions import Cast, Round, TruncMonth
+from django.utils.timezone import now
+
+from apps.core.services.version import CacheVersion
+from apps.dashboard.models import DailyTotal
+from apps.project.models import Project
+from apps.report.services.rounding import DurationRounding
+
+EARNINGS_KEY = "earnings:{}:{}:{}:{}"
+EARNINGS_VERSION_KEY = "earnings_version:{}"
+EARNINGS_TIMEOUT = 60 * 60 * 24 * 31
+EARNINGS_FIELDS = (
+    "project_id",
+    "project",
+    "client_id",
+    "client",
+    "payment_type",
+    "amount",
+    "month",
+    "minutes",
+    "revenue",
+)
+MONEY = DecimalField(max_digits=20, decimal_places=2)
+
+
+def get_next_month(month):
+    """Returns the first day of the month after the given one."""
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+class EarningsReport:
+    """Calculates the earnings of the billed projects per client, project
+    and month.
+
+    Hourly projects earn their amount per hour of the time tracked in the
+    month, rounded like the reports. Monthly projects earn their amount
+    once for every month with time tracked on them, whatever their current
+    status, since projects do not store when they started or ended. Both
+    come from one aggregate query over the daily totals.
+
+    Closed months are cached per user under a version, which is bumped
+    whenever a daily total of a closed month or a project or client of the
+    user changes, so month-end runs over all users are served from the
+    cache.
+
+    Args:
+        rounding (str): The rounding of the tracked time, see
+        DurationRounding.
+    """
+
+    version = CacheVersion(EARNINGS_VERSION_KEY)
+
+    def __init__(self, rounding=None):
+        self.rounding = DurationRounding(rounding)
+
+    @staticmethod
+    def get_months(first, last):
+        """Returns the first days of the months from first to last."""
+        months = []
+        month = first.replace(day=1)
+        while month <= last:
+            months.append(month)
+            month = get_next_month(month)
+        return months
+
+    @staticmethod
+    def is_closed(day):
+        """Returns whether the month of the day is over."""
+        return day < now().date().replace(day=1)
+
+    def get_queryset(self, user_id, first, last):
+        """Returns the earnings rows of the months from first to last.
+
+        The tracked time of the billed projects is aggregated per month
+        and project. Monthly projects earn their amount for every month in
+        which they have a daily total.
+
+        Args:
+            user_id (int): The owner of the projects.
+            first (date): The first day of the first month.
+            last (date): The first day of the last month.
+        """
+        return (
+            DailyTotal.objects.filter(
+                user_id=user_id,
+                day__gte=first,
+                day__lt=get_next_month(last),
+                project__billing=True,
+            )
+            .annotate(month=TruncMonth("day", output_field=DateField()))
+            .values("month", "project_id")
+            .annotate(minutes=self.rounding.get_expression(Sum("minutes")))
+            .annotate(
+                revenue=Case(
+                    When(
+                        project__payment_type=Project.Payment.MONTH,
+                        then=Cast("project__amount", MONEY),
+                    ),
+                    default=Round(
+                        Cast(F("minutes") * F("project__amount"), MONEY)
+                        / 60,
+                        2,
+                    ),
+                    output_field=MONEY,
+                )
+            )
+            .values_list(
+                "project_id",
+                "project__name",
+                "project__client_id",
+                "project__client__name",
+                "project__payment_type",
+                "project__amount",
+                "month",
+                "minutes",
+                "revenue",
+            )
+            .order_by()
+        )
+
+    def calculate(self, user_id, first, last):
+        """Returns the earnings rows of the months from first to last by
+        month.
+
+        Args:
+            user_id (int): The owner of the projects.
+            first (date): The first day of the first month.
+            last (date): The first day of the last month.
+        """
+        earnings = {month: [] for month in self.get_months(first, last)}
+        for values in self.get_queryset(user_id, first, last):
+            row = dict(zip(EARNINGS_FIELDS, values))
+            earnings[row["month"]].append(row)
+        for rows in earnings.values():
+            rows.sort(key=lambda row: (row["client"] or "", row["project"]))
+        return earnings
+
+    def get_earnings(self, user_id, first, last):
+        """Returns the earnings rows of the user for the months from first
+        to last, ordered by month, client and project.
+
+        Args:
+            user_id (int): The owner of the projects.
+            first (date): A day of the first month.
+            last (date): A day of the last month.
+
+        Returns:
+            list: The earnings rows as dicts with the EARNINGS_FIELDS keys.
+        """
+        months = self.get_months(first, last)
+        if not months:
+            return []
+        version = self.version.get(user_id)
+        keys = {
+            month: EARNINGS_KEY.format(
+                user_id, version, self.rounding.step, month.isoformat()
+            )
+            for month in months
+            if self.is_closed(month)
+        }
+        cached = cache.get_many(keys.values())
+        earnings = {
+            month: cached[key] for month, key in keys.items() if key in cached
+        }
+        missing = [month for month in months if month not in earnings]
+        if missing:
+            calculated = self.calculate(user_id, missing[0], missing[-1])
+            for month in missing:
+                earnings[month] = calculated[month]
+            cache.set_many(
+                {
+                    keys[month]: earnings[month]
+                    for month in missing
+                    if month in keys
+                },
+                EARNINGS_TIMEOUT,
+            )
+        return [row for month in months for row in earnings[month]]
+
+    def invalidate(self, user_id):
+        """Switches the user to a new earnings version."""
+        self.version.bump(user_id)
@@ -0,0 +1,144 @@
+import hashlib
+from io import BytesIO
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Table, TableStyle
+
+from apps.core.services.version import DataVersion
+from apps.report.services.rounding import DurationRounding
+
+REPORT_PDF_KEY = "report_pdf:v2:{}:{}"
+REPORT_PDF_TIMEOUT = 60 * 60 * 24
+REPORT_PDF_FONT = "ReportFont"
+TABLE_HEADER = ("Date", "Project Name", "Time", "Duration")
+
+
+class ReportPdfRenderer:
+    """Renders the time entries of a report to PDF.
+
+    Rendered files are cached by user, filter parameters, the latest
+    modification of the filtered entries and the data version of the user,
+    which also changes when a project or client is renamed, so repeated
+    downloads of an unchanged report are served from the cache.
+    """
+
+    def __init__(self):
+        self.font = self._get_font()
+
+    @staticmethod
+    def _get_font():
+        """Registers the TTF font used for non-latin text if available."""
+        font_path = Path(settings.REPORT_PDF_FONT_PATH)
+        if not font_path.is_file():
+            return "Helvetica"
+        if REPORT_PDF_FONT not in pdfmetrics.getRegisteredFontNames():
+            pdfmetrics.registerFont(TTFont(REPORT_PDF_FONT, font_path))
+        return REPORT_PDF_FONT
+
+    @staticmethod
+    def get_cache_key(user, params, queryset):
+        """Returns the cache key of the report.
+
+        Args:
+            user (User): The owner of the report.
+            params (QueryDict): The filter parameters of the report.
+            queryset (QuerySet): The filtered time entries.
+        """
+        stamp = queryset.aggregate(updated=Max("updated"), count=Count("id"))
+        version = DataVersion().get(user.pk)
+        digest = hashlib.md5(
+            f"{sorted(params.lists())}:{stamp['updated']}:{stamp['count']}:"
+            f"{version}".encode()
+        ).hexdigest()
+        return REPORT_PDF_KEY.format(user.pk, digest)
+
+    def get_rows(self, queryset):
+        """Returns the table rows of the report."""
+        rows = [TABLE_HEADER]
+        for day, project, start, stop, minutes in queryset.order_by(
+            "day", "start"
+        ).values_list(
+            "day", "project__name", "start", "stop", "rounded_minutes"
+        ):
+            rows.append(
+                (
+                    day.strftime("%d.%m.%Y"),
+                    project or "----",
+                    f"{start:%H:%M} - {stop:%H:%M}",
+                    DurationRounding.format(minutes),
+                )
+            )
+        return rows
+
+    def render(self, queryset, day, total_duration):
+        """Renders the report to PDF.
+
+        Args:
+            queryset (QuerySet): The filtered time entries.
+            day (slice): The date range of the report.
+            total_duration (str): The formatted total duration of the report.
+
+        Returns:
+            bytes: The PDF document.
+        """
+        styles = getSampleStyleSheet()
+        for style in ("Heading2", "Heading3"):
+            styles[style].fontName = self.font
+        period = f"{day.start:%d.%m.%Y} - {day.stop:%d.%m.%Y}"
+        table = Table(self.get_rows(queryset), repeatRows=1, hAlign="LEFT")
+        table.setStyle(
+            TableStyle(
+                [
+                    ("FONTNAME", (0, 0), (-1, -1), self.font),
+                    (
+                        "BACKGROUND",
+                        (0, 0),
+                        (-1, 0),
+                        colors.HexColor("#f2f2f2"),
+                    ),
+                    ("GRID", (0, 0), (-1, -1), 1, colors.HexColor("#dddddd")),
+                    ("PADDING", (0, 0), (-1, -1), 6),
+                ]
+            )
+        )
+        buffer = BytesIO()
+        SimpleDocTemplate(buffer, pagesize=A4, title=f"Report {period}").build(
+            [
+                Paragraph("Report", styles["Heading2"]),
+                Paragraph(period, styles["Heading3"]),
+                Paragraph(
+                    f"Total duration: {total_duration}", styles["Heading3"]
+                ),
+                table,
+            ]
+        )
+        return buffer.getvalue()
+
+    def get_pdf(self, user, params, queryset, day, get_total_duration):
+        """Returns the cached PDF of the report, rendering it if needed.
+
+        Args:
+            user (User): The owner of the report.
+            params (QueryDict): The filter parameters of the report.
+            queryset (QuerySet): The filtered time entries.
+            day (slice): The date range of the report.
+            get_total_duration (callable): Returns the total duration of
+            the report, called only when the report is rendered.
+
+        Returns:
+            bytes: The PDF document.
+        """
+        key = self.get_cache_key(user, params, queryset)
+        pdf = cache.get(key)
+        if pdf is None:
+            pdf = self.render(queryset, day, get_total_duration())
+            cache.set(key, pdf, REPORT_PDF_TIMEOUT)
+        return pdf
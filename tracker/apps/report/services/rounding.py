@@ -0,0 +1,48 @@
+from apps.core.functions import RoundedMinutes
+
+ROUNDING_CHOICES = (
+    ("hour", "Round to hours"),
+    ("quarter", "Round to 15 minutes"),
+    ("minute", "Exact minutes"),
+)
+ROUNDING_STEPS = {"hour": 60, "quarter": 15, "minute": 1}
+ROUNDING_TOTAL_FIELDS = {
+    "hour": "hour_minutes",
+    "quarter": "quarter_minutes",
+    "minute": "minutes",
+}
+DEFAULT_ROUNDING = "hour"
+
+
+class DurationRounding:
+    """Rounds the durations of a report.
+
+    The time entries store their exact duration in minutes, and every
+    report chooses how to round it, so changing the rounding does not
+    rewrite any rows. The duration of each entry is rounded by the
+    database, the total is the sum of the rounded durations, so it adds up
+    to the rows. The daily totals store that sum for every rounding in the
+    total_field.
+
+    Args:
+        rounding (str): The key of the rounding in ROUNDING_STEPS,
+        DEFAULT_ROUNDING if not given or unknown.
+    """
+
+    def __init__(self, rounding=None):
+        if rounding not in ROUNDING_STEPS:
+            rounding = DEFAULT_ROUNDING
+        self.step = ROUNDING_STEPS[rounding]
+        self.total_field = ROUNDING_TOTAL_FIELDS[rounding]
+
+    def get_expression(self, field="minutes"):
+        """Returns the SQL expression of the rounded duration in minutes."""
+        return RoundedMinutes(field, self.step)
+
+    @staticmethod
+    def format(minutes):
+        """Returns the minutes as hours and minutes, e.g. 1:05."""
+        if minutes is None:
+            return ""
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}:{minutes:02}"
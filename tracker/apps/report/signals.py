@@ -0,0 +1,35 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.client.models import Client
+from apps.dashboard.services.rollup import daily_totals_changed
+from apps.project.models import Project
+from apps.report.services.choices import ReportChoices
+from apps.report.services.earnings import EarningsReport
+
+
+@receiver(post_save, sender=Client)
+@receiver(post_delete, sender=Client)
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def invalidate_report_choices(sender, instance, **kwargs):
+    """Drops the cached report filter choices of the owner."""
+    ReportChoices().invalidate(instance.user_id)
+
+
+@receiver(post_save, sender=Client)
+@receiver(post_delete, sender=Client)
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def invalidate_earnings(sender, instance, **kwargs):
+    """Drops the cached earnings of the owner."""
+    EarningsReport().invalidate(instance.user_id)
+
+
+@receiver(daily_totals_changed)
+def invalidate_closed_earnings(sender, user_id, days, **kwargs):
+    """Drops the cached earnings of the user when the daily totals of a
+    closed month change.
+    """
+    if days is None or any(EarningsReport.is_closed(day) for day in days):
+        EarningsReport().invalidate(user_id)
@@ -0,0 +1,11 @@
+from django import template
+
+from apps.report.services.rounding import DurationRounding
+
+register = template.Library()
+
+
+@register.filter
+def duration(minutes):
+    """Formats a duration in minutes as hours and minutes, e.g. 1:05."""
+    return DurationRounding.format(minutes)
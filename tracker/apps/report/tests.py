@@ -0,0 +1,86 @@
+from datetime import date, time
+
+from django.urls import reverse
+from django.utils.timezone import now
+
+from apps.core.testing import TrackerTestCase
+from apps.dashboard.models import DailyTotal, Time
+from apps.dashboard.services.rollup import DailyTotalProcessor
+from apps.project.models import Project
+from apps.report.services.earnings import EarningsReport
+from apps.report.views import ReportsListView
+
+
+class ReportsListViewTest(TrackerTestCase):
+    def get_url(self, **params):
+        today = now().date().isoformat()
+        query = {"day_min": today, "day_max": today, **params}
+        return f"{reverse('report:report')}?" + "&".join(
+            f"{key}={value}" for key, value in query.items()
+        )
+
+    def test_query_budget(self):
+        response = self.assertWithinQueryBudget(
+            ReportsListView, self.get_url()
+        )
+        self.assertEqual(len(response.context["object_list"]), 3)
+
+    def test_total_adds_up_to_rows(self):
+        for rounding, total in (
+            ("hour", "0:00"),
+            ("quarter", "0:45"),
+            ("minute", "1:00"),
+        ):
+            with self.subTest(rounding=rounding):
+                response = self.client.get(self.get_url(rounding=rounding))
+                self.assertEqual(response.context["total_duration"], total)
+
+    def test_total_is_summed_over_daily_totals(self):
+        DailyTotal.objects.filter(user=self.user).update(
+            hour_minutes=600, quarter_minutes=615
+        )
+        for params, total in (
+            ({}, "10:00"),
+            ({"rounding": "quarter"}, "10:15"),
+        ):
+            with self.subTest(params=params):
+                response = self.client.get(self.get_url(**params))
+                self.assertEqual(response.context["total_duration"], total)
+
+
+class EarningsInvalidationTest(TrackerTestCase):
+    def test_closed_month_change_bumps_version(self):
+        report = EarningsReport()
+        version = report.version.get(self.user.pk)
+        DailyTotalProcessor.refresh(self.user.pk, None, now().date())
+        self.assertEqual(report.version.get(self.user.pk), version)
+        DailyTotalProcessor.refresh(self.user.pk, None, date(2020, 1, 1))
+        self.assertNotEqual(report.version.get(self.user.pk), version)
+
+
+class EarningsReportTest(TrackerTestCase):
+    def test_monthly_fee_only_for_tracked_months(self):
+        project = Project.objects.create(
+            user=self.user,
+            name="Retainer",
+            billing=True,
+            amount=500,
+            payment_type=Project.Payment.MONTH,
+            status=Project.Status.DONE,
+        )
+        Time.objects.create(
+            user=self.user,
+            project=project,
+            day=date(2020, 2, 10),
+            start=time(9, 0),
+            stop=time(10, 0),
+            duration=1,
+        )
+        DailyTotalProcessor.rebuild(self.user.pk)
+        rows = EarningsReport().get_earnings(
+            self.user.pk, date(2020, 1, 1), date(2020, 3, 1)
+        )
+        self.assertEqual(
+            [(row["month"], row["revenue"]) for row in rows],
+            [(date(2020, 2, 1), 500)],
+        )
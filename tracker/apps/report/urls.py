@@ -1,6 +1,11 @@
 from django.urls import path
 
-from apps.report.views import ReportsListView
+from apps.report.views import (
+    EarningsView,
+    ReportsListView,
+    ReportExportView,
+    ReportPdfView,
+)
 
 app_name = "report"
 
@@ -10,4 +15,19 @@ urlpatterns = [
         ReportsListView.as_view(),
         name="report",
     ),
+    path(
+        "export/",
+        ReportExportView.as_view(),
+        name="export",
+    ),
+    path(
+        "pdf/",
+        ReportPdfView.as_view(),
+        name="pdf",
+    ),
+    path(
+        "earnings/",
+        EarningsView.as_view(),
+        name="earnings",
+    ),
 ]
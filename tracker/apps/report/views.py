@@ -1,64 +1,327 @@
+import csv
+
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.db.models import Sum
+from django.http import HttpResponse, StreamingHttpResponse
+from django.shortcuts import redirect
+from django.urls import reverse
+from django.views import View
+from django.views.generic import TemplateView
 from django_filters.views import FilterView
 
-from apps.client.models import Client
-from apps.dashboard.models import Time
-from apps.project.models import Project
-from apps.report.filters import ReportFilter
+from apps.core.mixins import (
+    AsyncFilterViewMixin,
+    AsyncLoginRequiredMixin,
+    ConditionalGetMixin,
+)
+from apps.dashboard.models import DailyTotal, Time
+from apps.report.filters import DailyTotalFilter, ReportFilter
+from apps.report.forms import EarningsForm
+from apps.report.services.choices import ReportChoices
+from apps.report.services.earnings import EarningsReport
+from apps.report.services.pdf import ReportPdfRenderer
+from apps.report.services.rounding import DurationRounding
 
+EXPORT_CHUNK_SIZE = 2000
+EXPORT_HEADER = ("Date", "Project Name", "Time", "Duration")
 
-class ReportsListView(LoginRequiredMixin, FilterView):
-    """View for generating and displaying time-related reports.
+
+class ReportMixin:
+    """Mixin providing the filtered time entries and totals of a report.
 
     Attributes:
         model (Model): The model for which the view is created (Time).
         filterset_class (FilterSet): The filter set class for report filtering.
+        choices (dict): The project and client choices of the user.
+
+    Methods:
+        get_queryset(self): Returns the queryset of time entries available
+        for the report.
+        get_rounding(self): Returns the duration rounding of the report.
+        get_choices(self): Returns the project and client choices of the
+        user.
+        get_filterset(self, filterset_class=None): Returns the report filter
+        set of the user for the request.
+        get_total_queryset(self): Returns the daily totals matching the
+        filter.
+        get_total_duration(self): Returns the total duration of the filtered
+        time entries.
+        aget_total_duration(self): Async version of get_total_duration().
+    """
+
+    model = Time
+    filterset_class = ReportFilter
+    choices = None
+
+    def get_queryset(self):
+        """Returns the queryset of time entries available for the report.
+
+        The queryset is empty until a filter is applied. The durations
+        are rounded by the database into rounded_minutes.
+        """
+        if not self.request.GET:
+            return Time.objects.none()
+        return (
+            Time.objects.filter(
+                user=self.request.user,
+                stop__isnull=False,
+            )
+            .select_related("project")
+            .annotate(rounded_minutes=self.get_rounding().get_expression())
+        )
+
+    def get_rounding(self):
+        """Returns the duration rounding of the report."""
+        return DurationRounding(self.request.GET.get("rounding"))
+
+    def get_choices(self):
+        """Returns the project and client choices of the user."""
+        if self.choices is None:
+            self.choices = ReportChoices().get_choices(self.request.user)
+        return self.choices
+
+    def get_filterset(self, filterset_class=None):
+        """Returns the report filter set of the user for the request."""
+        filterset_class = filterset_class or self.filterset_class
+        return filterset_class(
+            self.request.GET or None,
+            queryset=self.get_queryset(),
+            request=self.request,
+            choices=self.get_choices(),
+        )
+
+    def get_total_queryset(self):
+        """Returns the daily totals matching the filter.
+
+        The total is summed over the daily rollup, so its cost depends on
+        the number of days in the range rather than the number of entries.
+        The rollup stores the durations rounded entry by entry for every
+        rounding, so the total adds up to the rows of the report.
+        """
+        return DailyTotalFilter(
+            self.filterset.data,
+            queryset=DailyTotal.objects.filter(user=self.request.user),
+            choices=self.filterset.choices,
+        ).qs
+
+    def get_total_duration(self):
+        """Returns the total duration of the filtered time entries."""
+        if not self.request.GET or not self.filterset.is_valid():
+            return ""
+        total = self.get_total_queryset().aggregate(
+            total=Sum(self.get_rounding().total_field)
+        )
+        return DurationRounding.format(total["total"])
+
+    async def aget_total_duration(self):
+        """Async version of get_total_duration()."""
+        if not self.request.GET or not self.filterset.is_valid():
+            return ""
+        total = await self.get_total_queryset().aaggregate(
+            total=Sum(self.get_rounding().total_field)
+        )
+        return DurationRounding.format(total["total"])
+
+
+class ReportsListView(
+    AsyncLoginRequiredMixin,
+    ReportMixin,
+    ConditionalGetMixin,
+    AsyncFilterViewMixin,
+    FilterView,
+):
+    """View for generating and displaying time-related reports.
+
+    The handler is a coroutine and queries the database with the async ORM.
+    Repeated requests are answered with 304 Not Modified until the user's
+    data changes.
+
+    Attributes:
         template_name (str): The name of the template to be rendered.
         request (HttpRequest): The HTTP request object.
+        query_budget (int): The maximum number of queries per GET request.
 
     Methods:
-        get_queryset(self): Returns the queryset of time entries based on
-        applied filters.
-        get_context_data(self, **kwargs): Returns the context data for
+        get(self, request, *args, **kwargs): Handles GET requests, loading
+        the filter choices beforehand.
+        aget_context_data(self, **kwargs): Returns the context data for
         rendering the template.
     """
 
-    model = Time
-    filterset_class = ReportFilter
     template_name = "report/report.html"
     request = None
+    query_budget = 6
 
-    def get_queryset(self):
-        """Returns the queryset of time entries based on applied filters."""
-        user = self.request.user
-        self.queryset = Time.objects.none()
-        self.filterset_class.base_filters[
-            "project"
-        ].queryset = Project.objects.filter(
-            user=self.request.user, payment_type=Project.Payment.HOUR
-        )
-        self.filterset_class.base_filters[
-            "project__client"
-        ].queryset = Client.objects.filter(user=self.request.user)
-
-        if self.request.GET:
-            self.queryset = self.filterset_class(
-                self.request.GET,
-                queryset=Time.objects.filter(
-                    user=user,
-                    stop__isnull=False,
-                ).select_related("project"),
-            ).qs
-        return self.queryset
+    async def get(self, request, *args, **kwargs):
+        """Handles GET requests, loading the filter choices beforehand.
 
-    def get_context_data(self, **kwargs):
+        Args:
+            request (HttpRequest): The HTTP request object.
+            *args: Additional positional arguments.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            HttpResponse: The HTTP response after processing the request.
+        """
+        self.choices = await ReportChoices().aget_choices(request.user)
+        return await super().get(request, *args, **kwargs)
+
+    async def aget_context_data(self, **kwargs):
         """Returns the context data for rendering the template."""
-        context = super().get_context_data(**kwargs)
-        total_duration = ""
-        if self.queryset:
-            total_duration = self.queryset.aggregate(Sum("duration"))[
-                "duration__sum"
-            ]
-        context.update({"total_duration": total_duration})
+        kwargs["object_list"] = [time async for time in kwargs["object_list"]]
+        context = await super().aget_context_data(**kwargs)
+        context.update({"total_duration": await self.aget_total_duration()})
         return context
+
+
+class Echo:
+    """File-like object that returns the written value instead of
+    buffering it.
+    """
+
+    @staticmethod
+    def write(value):
+        return value
+
+
+class ReportFileView(LoginRequiredMixin, ReportMixin, View):
+    """Base view for downloading the filtered time entries as a file.
+
+    Subclasses implement get_file_response(self, day), which returns the
+    response with the file of the date range.
+
+    Methods:
+        get_filename(self, day, extension): Returns the name of the file.
+        get(self, request, *args, **kwargs): Handles GET requests for
+        downloading the report.
+    """
+
+    @staticmethod
+    def get_filename(day, extension):
+        """Returns the name of the report file for the date range."""
+        return f"report_{day.start:%Y-%m-%d}_{day.stop:%Y-%m-%d}.{extension}"
+
+    def get(self, request, *args, **kwargs):
+        """Handles GET requests for downloading the report.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+            *args: Additional positional arguments.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            HttpResponse: The report file, or a redirect to the report
+            page if the filter is not valid.
+        """
+        self.filterset = self.get_filterset()
+        if not self.filterset.is_bound or not self.filterset.is_valid():
+            return redirect(
+                f"{reverse('report:report')}?{request.GET.urlencode()}"
+            )
+        return self.get_file_response(self.filterset.form.cleaned_data["day"])
+
+
+class ReportExportView(ReportFileView):
+    """View for exporting the filtered time entries as a CSV file.
+
+    Rows are streamed from a server-side cursor, so memory usage does not
+    grow with the size of the report.
+
+    Methods:
+        get_rows(self): Yields the CSV rows of the report.
+        get_file_response(self, day): Returns the streamed CSV file.
+    """
+
+    def get_rows(self):
+        """Yields the CSV rows of the report."""
+        yield EXPORT_HEADER
+        rows = (
+            self.filterset.qs.order_by("day", "start")
+            .values_list(
+                "day", "project__name", "start", "stop", "rounded_minutes"
+            )
+            .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        )
+        for day, project, start, stop, minutes in rows:
+            yield (
+                day.strftime("%d.%m.%Y"),
+                project or "----",
+                f"{start:%H:%M} - {stop:%H:%M}",
+                DurationRounding.format(minutes),
+            )
+        yield ("Total duration", "", "", self.get_total_duration())
+
+    def get_file_response(self, day):
+        """Returns the streamed CSV file.
+
+        Args:
+            day (slice): The date range of the report.
+        """
+        writer = csv.writer(Echo())
+        response = StreamingHttpResponse(
+            (writer.writerow(row) for row in self.get_rows()),
+            content_type="text/csv",
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="{self.get_filename(day, "csv")}"'
+        )
+        return response
+
+
+class ReportPdfView(ReportFileView):
+    """View for downloading the filtered time entries as a PDF file.
+
+    Methods:
+        get_file_response(self, day): Returns the PDF file.
+    """
+
+    def get_file_response(self, day):
+        """Returns the PDF file, rendered or taken from the cache.
+
+        Args:
+            day (slice): The date range of the report.
+        """
+        pdf = ReportPdfRenderer().get_pdf(
+            self.request.user,
+            self.request.GET,
+            self.filterset.qs,
+            day,
+            self.get_total_duration,
+        )
+        response = HttpResponse(pdf, content_type="application/pdf")
+        response["Content-Disposition"] = (
+            f'inline; filename="{self.get_filename(day, "pdf")}"'
+        )
+        return response
+
+
+class EarningsView(LoginRequiredMixin, TemplateView):
+    """View displaying the earnings of the billed projects per month.
+
+    Attributes:
+        template_name (str): The name of the template to be rendered.
+
+    Methods:
+        get_context_data(self, **kwargs): Returns the context data for
+        rendering the template.
+    """
+
+    template_name = "report/earnings.html"
+
+    def get_context_data(self, **kwargs):
+        """Returns the form, the earnings rows and their total revenue."""
+        form = EarningsForm(self.request.GET or None)
+        rows = []
+        if form.is_valid():
+            data = form.cleaned_data
+            rows = EarningsReport(data["rounding"]).get_earnings(
+                self.request.user.pk, data["first"], data["last"]
+            )
+        kwargs.update(
+            {
+                "form": form,
+                "rows": rows,
+                "total_revenue": sum(row["revenue"] for row in rows),
+            }
+        )
+        return super().get_context_data(**kwargs)
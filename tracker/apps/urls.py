@@ -6,6 +6,10 @@ urlpatterns = [
         "",
         include("apps.home.urls", namespace="home"),
     ),
+    path(
+        "api/",
+        include("apps.api.urls", namespace="api"),
+    ),
     path(
         "client/",
         include("apps.client.urls", namespace="client"),
@@ -0,0 +1,24 @@
+import multiprocessing
+import os
+
+WORKER_CLASSES = {
+    "sync": "sync",
+    "gthread": "gthread",
+    "uvicorn": "uvicorn.workers.UvicornWorker",
+}
+
+worker = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+# The settings close database connections after every request under ASGI.
+wsgi_app = "tracker.asgi" if worker == "uvicorn" else "tracker.wsgi"
+worker_class = WORKER_CLASSES[worker]
+workers = int(
+    os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1)
+)
+threads = int(os.getenv("GUNICORN_THREADS", 4 if worker == "gthread" else 1))
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", 100))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 30))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", 5))
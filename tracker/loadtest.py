@@ -0,0 +1,131 @@
+"""Load test showing how request throughput scales with gunicorn workers.
+
+Starts gunicorn with gunicorn.conf.py once per requested worker count,
+sends requests to one path from concurrent client threads for a fixed
+time and prints the results as JSON lines.
+
+Usage:
+    python loadtest.py --workers 1 2 4 --concurrency 32 --path /
+"""
+
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+HOST = "127.0.0.1"
+PORT = 8765
+
+
+def wait_for_server(timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection(HOST, PORT, timeout=1)
+            conn.request("GET", "/")
+            conn.getresponse().read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("gunicorn did not start")
+
+
+def client(path, headers, stop_at, results):
+    conn = http.client.HTTPConnection(HOST, PORT, timeout=30)
+    ok = errors = 0
+    latencies = []
+    while time.monotonic() < stop_at:
+        start = time.monotonic()
+        try:
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+            response.read()
+        except OSError:
+            errors += 1
+            conn.close()
+            conn = http.client.HTTPConnection(HOST, PORT, timeout=30)
+            continue
+        latencies.append(time.monotonic() - start)
+        if response.status < 400:
+            ok += 1
+        else:
+            errors += 1
+    results.append((ok, errors, latencies))
+
+
+def run(args, workers):
+    env = dict(
+        os.environ,
+        GUNICORN_BIND=f"{HOST}:{PORT}",
+        GUNICORN_WORKERS=str(workers),
+        GUNICORN_WORKER_CLASS=args.worker_class,
+    )
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "--config", "gunicorn.conf.py"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_server(timeout=30)
+        headers = {"Host": args.host}
+        if args.cookie:
+            headers["Cookie"] = args.cookie
+        results = []
+        stop_at = time.monotonic() + args.duration
+        threads = [
+            threading.Thread(
+                target=client, args=(args.path, headers, stop_at, results)
+            )
+            for _ in range(args.concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        server.terminate()
+        server.wait()
+    ok = sum(result[0] for result in results)
+    latencies = sorted(lat for result in results for lat in result[2])
+    return {
+        "workers": workers,
+        "worker_class": args.worker_class,
+        "concurrency": args.concurrency,
+        "path": args.path,
+        "requests": ok,
+        "errors": sum(result[1] for result in results),
+        "rps": round(ok / args.duration, 1),
+        "p50_ms": (
+            round(latencies[len(latencies) // 2] * 1000, 1)
+            if latencies
+            else None
+        ),
+        "p95_ms": (
+            round(latencies[int(len(latencies) * 0.95)] * 1000, 1)
+            if latencies
+            else None
+        ),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--worker-class", default="gthread")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--path", default="/")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--cookie", help="e.g. sessionid=<session key>")
+    args = parser.parse_args()
+    for workers in args.workers:
+        print(json.dumps(run(args, workers)), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -23,12 +24,14 @@ INSTALLED_APPS = [
     "django.contrib.staticfiles",
     "django_bootstrap5",
     "django_filters",
+    "apps.core",
     "apps.home",
     "apps.dashboard",
     "apps.client",
     "apps.project",
     "apps.report",
     "apps.profile",
+    "apps.api",
 ]
 
 MIDDLEWARE = [
@@ -36,11 +39,31 @@ MIDDLEWARE = [
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "apps.profile.middleware.CachedAuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+QUERY_METRICS = os.getenv("QUERY_METRICS", False) == "True"
+
+if QUERY_METRICS:
+    MIDDLEWARE.insert(0, "apps.core.middleware.QueryMetricsMiddleware")
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "apps.core.middleware": {
+            "handlers": ["console"],
+            "level": "INFO",
+            "propagate": False,
+        },
+    },
+}
+
 ROOT_URLCONF = "tracker.urls"
 
 TEMPLATES_DIR = BASE_DIR / "templates"
@@ -66,6 +89,10 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "tracker.wsgi.application"
 
+# Under ASGI the sync ORM runs in threads whose persistent connections are
+# never reused or closed, so they leak (Django ticket #33497).
+ASGI_WORKER = os.getenv("GUNICORN_WORKER_CLASS") == "uvicorn"
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
@@ -74,9 +101,51 @@ DATABASES = {
         "PASSWORD": os.getenv("POSTGRES_PASSWORD", "postgres"),
         "HOST": os.getenv("DB_HOST", "localhost"),
         "PORT": os.getenv("DB_PORT", 5432),
+        "CONN_MAX_AGE": (
+            0 if ASGI_WORKER else int(os.getenv("DB_CONN_MAX_AGE", 60))
+        ),
+        "CONN_HEALTH_CHECKS": os.getenv("DB_CONN_HEALTH_CHECKS", "True")
+        == "True",
+        "DISABLE_SERVER_SIDE_CURSORS": os.getenv(
+            "DB_DISABLE_SERVER_SIDE_CURSORS", False
+        )
+        == "True",
+    }
+}
+
+CACHE_BACKENDS = {
+    "redis": "django.core.cache.backends.redis.RedisCache",
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+}
+CACHE_LOCATIONS = {
+    "redis": "redis://redis:6379/0",
+    "locmem": "fixtime",
+    "file": Path(tempfile.gettempdir()) / "fixtime_cache",
+}
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "locmem")
+
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKENDS[CACHE_BACKEND],
+        "LOCATION": os.getenv(
+            "CACHE_LOCATION", CACHE_LOCATIONS[CACHE_BACKEND]
+        ),
     }
 }
 
+# Redis evicts by its own maxmemory policy, the local backends cull.
+if CACHE_BACKEND != "redis":
+    CACHES["default"]["OPTIONS"] = {
+        "MAX_ENTRIES": int(os.getenv("CACHE_MAX_ENTRIES", 10000)),
+    }
+
+SESSION_ENGINE = "django.contrib.sessions.backends." + os.getenv(
+    "SESSION_BACKEND", "cached_db"
+)
+
+AUTH_USER_CACHE_TIMEOUT = int(os.getenv("AUTH_USER_CACHE_TIMEOUT", 300))
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -99,6 +168,16 @@ USE_TZ = False
 
 STATIC_URL = "/static/"
 STATIC_ROOT = BASE_DIR / "static"
+STATICFILES_DIRS = [BASE_DIR / "static_front"]
+
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "apps.core.storage.CompressedManifestStaticFilesStorage",
+    },
+}
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
@@ -123,5 +202,23 @@ DEFAULT_FROM_EMAIL = EMAIL_HOST_USER
 SERVER_EMAIL = EMAIL_HOST_USER
 EMAIL_ADMIN = EMAIL_HOST_USER
 
+REPORT_PDF_FONT_PATH = os.getenv(
+    "REPORT_PDF_FONT_PATH", "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+)
+
+BOOTSTRAP_ASSETS = os.getenv("BOOTSTRAP_ASSETS", "static")
+BOOTSTRAP5 = {
+    "css_url": {
+        "url": "https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css",
+        "integrity": "sha384-QWTKZyjpPEjISv5WaRU9OFeRpok6YctnYmDr5pNlyT2bRjXh0JMhjY6hW+ALEwIH",
+        "crossorigin": "anonymous",
+    },
+    "javascript_url": {
+        "url": "https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/js/bootstrap.bundle.min.js",
+        "integrity": "sha384-YvpcrYf0tY3lHB60NNkmXc5s9fDVZLESaAA55NDzOxhy9GkcIdslK1eN7N6jIeHz",
+        "crossorigin": "anonymous",
+    },
+}
+
 FILTERS_EMPTY_CHOICE_LABEL = "All"
 FILTERS_NULL_CHOICE_LABEL = "----"